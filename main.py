@@ -1,69 +1,148 @@
 import os
-import random
 from dotenv import load_dotenv
-from src.crawlers.hacker_news import HackerNewsCrawler
-from src.crawlers.techcrunch import TechCrunchCrawler
-from src.crawlers.theverge import TheVergeCrawler
-from src.crawlers.wired import WiredCrawler
-from src.crawlers.arstechnica import ArsTechnicaCrawler
-from src.crawlers.venturebeat import VentureBeatCrawler
+from src.crawlers.feeds import build_crawlers
+from src.crawlers.fanout import fetch_all, crawler_name
 from src.processor.llm_rewriter import ContentProcessor
 from src.publisher.blogger_client import BloggerPublisher
+from src.processor.extractor import ArticleExtractor
+from src.processor.dedup import NearDuplicateIndex, dedupe_items, item_signature
+from src.processor.ranking import select_top_k
+from src.processor.relevance import RelevanceClassifier
+from src.storage import SeenStore, canonicalize_url, data_path
 
 load_dotenv()
 
+# 실행당 발행할 최대 글 수
+MAX_POSTS_PER_RUN = int(os.getenv("MAX_POSTS_PER_RUN", "3"))
+# 소스별 크롤링 마감 시간 (초)
+CRAWL_TIMEOUT = float(os.getenv("CRAWL_TIMEOUT", "20"))
+# 소스당 후보 풀에 넣을 기사 수
+ITEMS_PER_SOURCE = int(os.getenv("ITEMS_PER_SOURCE", "10"))
+# 한 소스에서 실행당 발행할 최대 글 수 (다양성 확보)
+MAX_PER_SOURCE = int(os.getenv("MAX_PER_SOURCE", "1"))
+# 처리 기록 보관 기간 (일)
+SEEN_TTL_DAYS = float(os.getenv("SEEN_TTL_DAYS", "30"))
+# 원문 기사 본문 추출 사용 여부
+ARTICLE_EXTRACTION = os.getenv("ARTICLE_EXTRACTION", "true").lower() in ("1", "true", "yes")
+# 재작성 방식: single(기사별 요청) 또는 batch(한 번에 제출)
+REWRITE_MODE = os.getenv("REWRITE_MODE", "single").lower()
+
 def main():
     print("=== AI Feed Automation Started (SEO Optimized) ===")
     
-    # 모든 크롤러 목록
-    all_crawlers = [
-        HackerNewsCrawler(),
-        TechCrunchCrawler(),
-        TheVergeCrawler(),
-        WiredCrawler(),
-        ArsTechnicaCrawler(),
-        VentureBeatCrawler(),
-    ]
+    # 모든 크롤러 목록 (Hacker News + 피드 레지스트리)
+    all_crawlers = build_crawlers()
+    
+    # 이미 처리한 기사 기록 (오래된 기록은 정리)
+    seen_store = SeenStore()
+    pruned = seen_store.prune(SEEN_TTL_DAYS)
+    if pruned:
+        print(f"Pruned {pruned} old seen records")
+    
+    # 과거에 발행한 기사의 MinHash 서명 (유사 기사 재발행 방지)
+    dedup_history = NearDuplicateIndex(data_path("dedup.sqlite3"))
+    dedup_history.prune(SEEN_TTL_DAYS)
+    
+    # 모든 소스를 동시에 크롤링 (소스별 마감 시간 내에 끝난 결과만 사용)
+    crawled = fetch_all(all_crawlers, limit=ITEMS_PER_SOURCE, default_timeout=CRAWL_TIMEOUT)
+    
+    # 모든 소스의 후보를 하나의 풀로 모으고 이미 처리한 기사 제외
+    pool = []
+    for name, items in crawled.items():
+        unseen = seen_store.filter_unseen(items)
+        if len(unseen) < len(items):
+            print(f"[seen] {name}: {len(items) - len(unseen)}개 건너뜀")
+        pool.extend(unseen)
+    
+    # AI와 무관한 기사 제외 (로컬 분류기, API 호출 없음)
+    pool = RelevanceClassifier().filter(pool)
+    
+    # 여러 소스에 올라온 같은 기사는 대표 1개만 남김
+    pool = dedupe_items(pool, history=dedup_history)
+    
+    # 점수 상위 기사 선택 (최신성, 반응, 소스 가중치, 새로움)
+    source_weights = {crawler_name(c): getattr(c, "weight", 1.0) for c in all_crawlers}
+    selected = select_top_k(pool, MAX_POSTS_PER_RUN, max_per_source=MAX_PER_SOURCE,
+                            source_weights=source_weights, history=dedup_history)
+    print(f"Candidate pool: {len(pool)} → selected {len(selected)}")
+    for item in selected:
+        print(f"  [{item['rank_score']:.3f}] {item['source']}: {item['title']}")
     
-    # 랜덤으로 3개 소스 선택 (다양성 확보)
-    selected_crawlers = random.sample(all_crawlers, min(3, len(all_crawlers)))
-    print(f"Selected sources: {[type(c).__name__ for c in selected_crawlers]}")
+    # 선택된 기사만 원문 본문 추출 (중복 제거를 통과한 뒤, 동시에 실행)
+    if ARTICLE_EXTRACTION:
+        ArticleExtractor().extract_items(selected)
     
     processor = ContentProcessor()
     publisher = BloggerPublisher()
     
     # 성공적으로 발행된 글 목록 (내부 링크용)
     published_posts = []
+    # 재작성 토큰 사용량 합계
+    total_usage = {"input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0}
     
-    for crawler in selected_crawlers:
+    # 대체 백엔드(REWRITE_BACKEND=local)는 자리표시 본문을 만들므로 발행하지 않고 결과만 확인
+    if processor.local_backend:
+        print("🧪 REWRITE_BACKEND=local: rewriting only, nothing will be published")
+    
+    # 배치 모드면 선택된 기사를 한 번에 재작성 (배치 전체가 실패하면 기사별 재작성으로 진행)
+    batch_results = {}
+    if REWRITE_MODE == "batch" and selected:
         try:
-            items = crawler.fetch_latest(limit=1)  # 소스당 1개씩
-            for item in items:
-                print(f"\n📝 Processing: {item['title']}")
-                
-                # 콘텐츠 처리 (SEO 최적화 적용)
-                processed = processor.process_content(item)
-                
-                # 메타 설명 출력 (디버그용)
-                if processed.get("meta_description"):
-                    print(f"📋 Meta: {processed['meta_description'][:50]}...")
-                
-                # 발행
-                link = publisher.post_article(processed, is_draft=False)
-                print(f"✅ Result: {link}")
+            for item, processed in zip(selected, processor.process_batch(selected)):
+                batch_results[item["url"]] = processed
+        except Exception as e:
+            print(f"❌ Batch rewrite failed, falling back to per-article rewrite: {e}")
+            batch_results = {}
+    
+    for item in selected:
+        try:
+            print(f"\n📝 Processing: {item['title']}")
+            
+            # 콘텐츠 처리 (SEO 최적화 적용)
+            processed = batch_results.get(item["url"]) or processor.process_content(item)
+            
+            # 토큰 사용량 집계
+            usage = processed.get("usage")
+            if usage:
+                for key in total_usage:
+                    total_usage[key] += usage.get(key, 0)
+                print(f"🔢 Tokens: in {usage['input_tokens']} (cached {usage['cached_input_tokens']}) / out {usage['output_tokens']}")
+            
+            # 재작성에 실패한 글은 발행하지 않음 (다음 실행에서 다시 시도)
+            if processed.get("error"):
+                print(f"⏭️ Skipped: rewrite failed ({processed['error']})")
+                continue
+            
+            if processor.local_backend:
+                print(f"🧪 Not published (local backend): {processed['title']}")
+                continue
+            
+            # 메타 설명 출력 (디버그용)
+            if processed.get("meta_description"):
+                print(f"📋 Meta: {processed['meta_description'][:50]}...")
+            
+            # 발행
+            link = publisher.post_article(processed, is_draft=False)
+            print(f"✅ Result: {link}")
+            
+            # 발행 성공 시 내부 링크 목록에 추가
+            if link and not link.startswith("Error") and not link.startswith("Skipped"):
+                seen_store.mark_seen(item)
+                dedup_history.add(canonicalize_url(item["url"]), item_signature(item))
+                processor.add_recent_post(processed["title"], link, processed.get("tags"),
+                                          processed.get("body", processed["content"]))
+                # 글에 들어간 이미지 기록 (만료 전 다시 올릴 때 고칠 글 목록)
+                processor.image_generator.image_store.link_post(link, processed["content"])
+                published_posts.append({
+                    "title": processed["title"],
+                    "url": link
+                })
                 
-                # 발행 성공 시 내부 링크 목록에 추가
-                if link and not link.startswith("Error") and not link.startswith("Skipped"):
-                    processor.add_recent_post(processed["title"], link)
-                    published_posts.append({
-                        "title": processed["title"],
-                        "url": link
-                    })
-                    
         except Exception as e:
-            print(f"❌ Error with {type(crawler).__name__}: {e}")
+            print(f"❌ Error with {item['source']}: {e}")
     
     print(f"\n=== Finished: {len(published_posts)} posts published ===")
+    print(f"🔢 Total tokens: in {total_usage['input_tokens']} (cached {total_usage['cached_input_tokens']}) / out {total_usage['output_tokens']}")
     
     # 발행된 글 목록 출력
     if published_posts:
@@ -0,0 +1,77 @@
+"""
+유사 기사 탐지 기준 확인
+
+같은 발표를 여러 소스가 다룬 제목 쌍은 묶이고, 단어 하나만 겹치는 다른 기사는 묶이지 않는지 확인합니다.
+DEFAULT_THRESHOLD, MIN_SHARED_TOKENS, 불용어를 바꿨다면 실행해 보세요. (실패하면 종료 코드 1)
+
+사용법:
+    python scripts/check_dedup.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.processor.dedup import DEFAULT_THRESHOLD, dedupe_items, item_signature, similarity  # noqa: E402
+
+# 같은 GPT-5 발표를 다룬 TechCrunch / The Verge / Hacker News 항목 (HN은 제목만 있음)
+SAME_STORY = [
+    {"source": "TechCrunch", "url": "https://techcrunch.com/gpt-5",
+     "title": "OpenAI launches GPT-5, its new flagship AI model",
+     "original_content": "OpenAI on Thursday released GPT-5, the company's latest flagship model, "
+                         "which will power ChatGPT for free and paid users."},
+    {"source": "The Verge", "url": "https://www.theverge.com/gpt-5",
+     "title": "OpenAI's GPT-5 is here, and it's available to everyone",
+     "original_content": "OpenAI is releasing GPT-5 to all ChatGPT users today."},
+    {"source": "Hacker News", "url": "https://news.ycombinator.com/item?id=1",
+     "title": "OpenAI releases GPT-5", "original_content": ""},
+]
+
+# 같은 발표 (표현이 다름)
+SAME_PAIRS = [
+    ("Nvidia unveils Blackwell Ultra chips at GTC", "Nvidia announces Blackwell Ultra GPUs"),
+    ("Anthropic raises $13B at $183B valuation", "Anthropic raises $13 billion in Series F funding"),
+]
+
+# 다른 기사 (회사명/모델명 하나만 겹침)
+DIFFERENT_PAIRS = [
+    ("OpenAI launches GPT-5, its new flagship AI model",
+     "Researchers find GPT-5 still hallucinates on medical questions"),
+    ("Google releases Gemini 2.5 Pro", "OpenAI releases GPT-5"),
+    ("Meta hires OpenAI researchers for superintelligence lab",
+     "OpenAI launches GPT-5, its new flagship AI model"),
+]
+
+
+def score(title_a: str, title_b: str) -> float:
+    return similarity(item_signature({"title": title_a}).tokens, item_signature({"title": title_b}).tokens)
+
+
+def main() -> int:
+    failures = []
+    kept = dedupe_items([dict(item) for item in SAME_STORY])
+    print(f"같은 기사 {len(SAME_STORY)}개 → {len(kept)}개 남음 ({kept[0]['source'] if kept else '-'})")
+    if len(kept) != 1:
+        failures.append("같은 발표를 다룬 세 소스가 하나로 묶이지 않음")
+
+    for title_a, title_b in SAME_PAIRS:
+        value = score(title_a, title_b)
+        print(f"[같음 {value:.2f}] {title_a} / {title_b}")
+        if value < DEFAULT_THRESHOLD:
+            failures.append(f"같은 기사를 놓침: {title_a} / {title_b}")
+
+    for title_a, title_b in DIFFERENT_PAIRS:
+        value = score(title_a, title_b)
+        print(f"[다름 {value:.2f}] {title_a} / {title_b}")
+        if value >= DEFAULT_THRESHOLD:
+            failures.append(f"다른 기사를 묶음: {title_a} / {title_b}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("OK" if not failures else f"{len(failures)}개 실패")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
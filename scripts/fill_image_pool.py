@@ -0,0 +1,54 @@
+"""
+주제별 이미지 풀 채우기
+
+src/processor/image_pool.py의 주제마다 IMAGE_POOL_SIZE장씩 이미지를 미리 생성/업로드합니다.
+이미 있고 곧 만료되지 않는 슬롯은 건너뛰므로, 처음 한 번 이후에는 빈 슬롯만 채웁니다.
+곧 만료되지만 글에 쓰이고 있는 슬롯은 refresh_images.py가 다시 올리도록 남겨 둡니다.
+
+사용법:
+    python scripts/fill_image_pool.py
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.processor.image_generator import ImageGenerator  # noqa: E402
+from src.processor.image_pool import TopicImagePool  # noqa: E402
+
+load_dotenv()
+
+# 한 번 실행에서 새로 만들 최대 이미지 수 (워크플로 실행 시간 제한)
+FILL_LIMIT = int(os.getenv("IMAGE_POOL_FILL_LIMIT", "5"))
+FILL_CONCURRENCY = int(os.getenv("IMAGE_POOL_FILL_CONCURRENCY", "2"))
+
+
+def main():
+    generator = ImageGenerator()
+    if not (generator.client and generator.imgbb_key):
+        print("GEMINI_API_KEY 또는 IMGBB_API_KEY가 없어 종료합니다.")
+        return
+
+    pool = generator.image_pool or TopicImagePool(generator.image_store)
+    missing = pool.missing(min_ttl=generator.refresh_window)
+    print(f"비어 있는 풀 슬롯: {len(missing)}개 (이번 실행 최대 {FILL_LIMIT}개)")
+
+    def fill(entry) -> bool:
+        topic, slot, prompt = entry
+        key = pool.slot_prompt(topic, slot)
+        url = generator.generate_and_upload(prompt, use_pool=False, store_key=key)
+        # 실패하면 fallback URL이 오므로 저장소에 기록됐는지로 성공 여부 판단
+        return url is not None and url == generator.image_store.get(key)
+
+    with ThreadPoolExecutor(max_workers=FILL_CONCURRENCY) as executor:
+        filled = sum(executor.map(fill, missing[:FILL_LIMIT]))
+    print(f"풀 이미지 생성: {filled}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+만료가 가까운 이미지 다시 올리기
+
+ImgBB에 만료 시간을 두고 올린 이미지는 기간이 지나면 삭제되어 글의 이미지가 깨집니다.
+이 스크립트는 IMAGE_REFRESH_DAYS 안에 만료되는 이미지를 저장해 둔 원본 파일로 다시 올리고,
+그 이미지를 쓰는 Blogger 글 본문의 URL을 한 글당 한 번의 PATCH로 모두 교체합니다.
+
+사용법:
+    python scripts/refresh_images.py
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.processor.image_generator import ImageGenerator  # noqa: E402
+from src.publisher.blogger_client import BloggerPublisher  # noqa: E402
+
+load_dotenv()
+
+REFRESH_CONCURRENCY = int(os.getenv("IMAGE_REFRESH_CONCURRENCY", "4"))
+
+
+def load_image(store, image) -> bytes:
+    """저장된 원본 파일, 없으면 아직 살아 있는 기존 URL에서 받아옴"""
+    path = store.file_path(image["file"])
+    if path:
+        return path.read_bytes()
+    response = requests.get(image["url"], timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def rewrite_post(publisher, post_url: str, replacements: dict) -> bool:
+    """글 본문의 이미지 URL을 한 번에 교체"""
+    post = publisher.get_post_by_url(post_url)
+    if not post:
+        return False
+    content = post.get("content") or ""
+    for old_url, new_url in replacements.items():
+        content = content.replace(old_url, new_url)
+    if content == post.get("content"):
+        return True
+    return publisher.update_post_content(post["id"], content)
+
+
+def main():
+    generator = ImageGenerator()
+    store = generator.image_store
+    if not generator.imgbb_key:
+        print("IMGBB_API_KEY가 없어 종료합니다.")
+        return
+
+    expiring = store.expiring(generator.refresh_window)
+    print(f"만료 예정 이미지: {len(expiring)}개")
+
+    # 1. 다시 올리기
+    rehosted = []
+    for image in expiring:
+        posts = store.posts_using(image["url"])
+        if not posts:
+            continue  # 쓰는 글이 없으면 만료 후 prune()에서 정리
+        try:
+            new_url = generator.upload_image(load_image(store, image))
+        except Exception as e:
+            print(f"[refresh] 원본을 가져오지 못함: {image['url']} - {e}")
+            continue
+        if new_url:
+            rehosted.append((image, new_url, posts))
+        else:
+            print(f"[refresh] 업로드 실패: {image['url']}")
+
+    # 2. 글별로 교체할 URL 모아서 한 번씩 수정
+    replacements = {}
+    for image, new_url, posts in rehosted:
+        for post_url in posts:
+            replacements.setdefault(post_url, {})[image["url"]] = new_url
+
+    publisher = BloggerPublisher()
+    post_urls = list(replacements)
+    with ThreadPoolExecutor(max_workers=REFRESH_CONCURRENCY) as executor:
+        results = dict(zip(post_urls, executor.map(
+            lambda url: rewrite_post(publisher, url, replacements[url]), post_urls
+        )))
+
+    # 3. 연결된 글을 모두 고친 이미지만 저장소 갱신 (실패하면 다음 실행에서 다시 시도)
+    refreshed = 0
+    for image, new_url, posts in rehosted:
+        if all(results.get(post_url) for post_url in posts):
+            store.replace_url(image["url"], new_url, generator.expires_at())
+            refreshed += 1
+    print(f"다시 올린 이미지: {refreshed}개, 수정한 글: {sum(results.values())}/{len(results)}개")
+
+    pruned = store.prune()
+    if pruned:
+        print(f"만료된 이미지 기록 정리: {pruned}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,13 @@ import os
 import hmac
 import hashlib
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
+from .keyword_matcher import KeywordMatcher
+from ..storage import PersistentCache, data_path
 
 
 class CoupangPartnersAPI:
@@ -117,6 +121,7 @@ class CoupangProductRecommender:
     """AI 글에 맞는 쿠팡 상품 추천"""
     
     # AI/테크 관련 키워드 매핑
+    # 상품 추천은 재작성 전 원문(영문)으로 하므로 한글 키워드에는 영문 표현도 함께 둠
     KEYWORD_MAPPING = {
         # AI/ChatGPT 관련
         "chatgpt": ["AI 스피커", "무선 키보드", "노트북 거치대"],
@@ -134,36 +139,133 @@ class CoupangProductRecommender:
         # 로봇/자율주행
         "robot": ["로봇청소기", "코딩 로봇", "드론"],
         "자율주행": ["블랙박스", "차량용 충전기", "차량용 거치대"],
+        "self-driving": ["블랙박스", "차량용 충전기", "차량용 거치대"],
+        "self driving": ["블랙박스", "차량용 충전기", "차량용 거치대"],
+        "autonomous": ["블랙박스", "차량용 충전기", "차량용 거치대"],
+        "robotaxi": ["블랙박스", "차량용 충전기", "차량용 거치대"],
+        "waymo": ["블랙박스", "차량용 충전기", "차량용 거치대"],
         "tesla": ["전기차 충전기", "차량용 액세서리", "블랙박스"],
         
         # 일반 테크
         "ai": ["AI 스피커", "스마트홈", "무선 이어폰"],
         "tech": ["무선 충전기", "보조배터리", "USB 허브"],
         "반도체": ["외장 SSD", "메모리카드", "노트북"],
+        "semiconductor": ["외장 SSD", "메모리카드", "노트북"],
+        "chip": ["외장 SSD", "메모리카드", "노트북"],
+        "chips": ["외장 SSD", "메모리카드", "노트북"],
+        "tsmc": ["외장 SSD", "메모리카드", "노트북"],
         "엔비디아": ["그래픽카드", "게이밍 마우스", "게이밍 키보드"],
+        "nvidia": ["그래픽카드", "게이밍 마우스", "게이밍 키보드"],
+        "gpu": ["그래픽카드", "게이밍 마우스", "게이밍 키보드"],
+        "gpus": ["그래픽카드", "게이밍 마우스", "게이밍 키보드"],
         
         # 기본
         "default": ["무선 이어폰", "보조배터리", "USB 충전기"]
     }
     
+    # 키워드 가중치 (구체적인 키워드일수록 큼, 없으면 1.0)
+    KEYWORD_WEIGHTS = {
+        "ai": 0.5,
+        "tech": 0.3,
+        "gpt": 0.8,
+        "chip": 0.8,
+        "chips": 0.8,
+    }
+    # 제목에 나온 키워드는 본문보다 이 배수만큼 더 셈
+    TITLE_WEIGHT = 3
+    
+    _matcher = None
+    
     def __init__(self):
         self.api = CoupangPartnersAPI()
+        
+        # 검색 결과/딥링크 캐시
+        # COUPANG_CACHE_TTL_HOURS가 지난 결과는 그대로 쓰면서 백그라운드에서 갱신하고,
+        # COUPANG_CACHE_MAX_AGE_DAYS가 지나면 버림
+        self.fresh_ttl = float(os.getenv("COUPANG_CACHE_TTL_HOURS", "24")) * 3600
+        self.cache = PersistentCache(
+            data_path("coupang_cache.sqlite3"),
+            max_entries=int(os.getenv("COUPANG_CACHE_MAX_ENTRIES", "500")),
+            ttl=float(os.getenv("COUPANG_CACHE_MAX_AGE_DAYS", "7")) * 86400,
+        )
+        self._refresher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coupang-refresh")
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+    
+    def _search(self, keyword: str, limit: int) -> List[Dict[str, Any]]:
+        """캐시를 거친 상품 검색 (오래된 결과는 바로 반환하고 백그라운드에서 갱신)"""
+        key = f"search:{keyword}:{limit}"
+        entry = self.cache.get_with_age(key)
+        if entry is None:
+            return self._search_and_store(key, keyword, limit)
+        
+        products, age = entry
+        if age > self.fresh_ttl:
+            with self._refresh_lock:
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._refresher.submit(self._refresh, key, keyword, limit)
+        return products
+    
+    def _search_and_store(self, key: str, keyword: str, limit: int) -> List[Dict[str, Any]]:
+        products = self.api.search_products(keyword, limit=limit)
+        # 빈 결과는 API 오류일 수 있으므로 저장하지 않음
+        if products:
+            self.cache.set(key, products)
+        return products
+    
+    def _refresh(self, key: str, keyword: str, limit: int):
+        try:
+            self._search_and_store(key, keyword, limit)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+    
+    def _deeplink(self, product_url: str) -> Optional[str]:
+        """캐시를 거친 딥링크 변환 (상품 URL별 딥링크는 바뀌지 않으므로 만료 전까지 재사용)"""
+        key = f"deeplink:{product_url}"
+        link = self.cache.get(key)
+        if link is None:
+            link = self.api.get_deeplink(product_url)
+            if link:
+                self.cache.set(key, link)
+        return link
+    
+    @classmethod
+    def _get_matcher(cls) -> KeywordMatcher:
+        """매핑 키워드 매처 (처음 한 번만 생성)"""
+        if cls._matcher is None:
+            cls._matcher = KeywordMatcher(key for key in cls.KEYWORD_MAPPING if key != "default")
+        return cls._matcher
     
     def _extract_keywords(self, title: str, content: str) -> List[str]:
-        """글에서 관련 키워드 추출"""
-        text = (title + " " + content).lower()
-        keywords = []
+        """
+        글에서 관련 검색어 추출
+        점수 = 가중치 × (제목 등장 수 × TITLE_WEIGHT + 본문 등장 수), 점수가 같으면 매핑 순서
+        """
+        matcher = self._get_matcher()
+        title_counts = matcher.count(title)
+        body_counts = matcher.count(content)
         
-        for key in self.KEYWORD_MAPPING.keys():
-            if key != "default" and key in text:
-                keywords.extend(self.KEYWORD_MAPPING[key])
+        order = {key: i for i, key in enumerate(self.KEYWORD_MAPPING)}
+        scores = {
+            key: self.KEYWORD_WEIGHTS.get(key, 1.0)
+            * (title_counts.get(key, 0) * self.TITLE_WEIGHT + body_counts.get(key, 0))
+            for key in set(title_counts) | set(body_counts)
+        }
+        ranked = sorted(scores, key=lambda key: (-scores[key], order.get(key, len(order))))
+        
+        keywords = []
+        for key in ranked:
+            for keyword in self.KEYWORD_MAPPING[key]:
+                if keyword not in keywords:
+                    keywords.append(keyword)
         
         # 키워드가 없으면 기본값 사용
         if not keywords:
             keywords = self.KEYWORD_MAPPING["default"]
         
-        # 중복 제거
-        return list(set(keywords))[:3]
+        return keywords[:3]
     
     def get_product_recommendations(self, title: str, content: str = "") -> List[Dict[str, Any]]:
         """글에 맞는 상품 추천"""
@@ -171,7 +273,7 @@ class CoupangProductRecommender:
         
         all_products = []
         for keyword in keywords:
-            products = self.api.search_products(keyword, limit=1)
+            products = self._search(keyword, limit=1)
             all_products.extend(products)
             
             if len(all_products) >= 3:
@@ -206,7 +308,7 @@ class CoupangProductRecommender:
             url = product.get("productUrl", "")
             
             # 딥링크 생성 시도
-            affiliate_url = self.api.get_deeplink(url) or url
+            affiliate_url = self._deeplink(url) or url
             
             price_formatted = f"{price:,}원" if price else "가격 확인"
             
@@ -0,0 +1,109 @@
+"""
+키워드 매처 (Aho-Corasick)
+=============================
+키워드 사전을 한 번 오토마톤으로 만들어 두고, 본문을 한 번만 훑어서
+모든 키워드의 등장 횟수를 셉니다. 비용은 본문 길이에 비례하고 키워드 수와는 거의 무관합니다.
+
+단어 경계 규칙
+- 영문/숫자 키워드: 앞뒤가 영문/숫자가 아니어야 함 ("ai"는 "said"에 매칭되지 않음)
+- 한글 키워드: 뒤에는 조사가 붙을 수 있으므로 제한 없음 ("반도체가", "엔비디아의"),
+  앞은 한글이 아니어야 하지만 3글자 이상 키워드는 합성어 안에서도 인정 ("완전자율주행")
+"""
+
+import html
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+# 합성어 안에서도 인정하는 한글 키워드 최소 길이
+HANGUL_COMPOUND_MIN_LEN = 3
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣" or "ㄱ" <= ch <= "ㆎ"
+
+
+def normalize_text(text: str) -> str:
+    """HTML 태그 제거, 엔티티 복원, 소문자화, 공백 정리"""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text or ""))).lower()
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        seen = set()
+        for keyword in keywords:
+            normalized = _SPACE_RE.sub(" ", keyword.strip().lower())
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                self._insert(normalized, len(self.keywords))
+                self.keywords.append(normalized)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, index: int):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _accept(self, text: str, start: int, end: int, keyword: str) -> bool:
+        """단어 경계 규칙 확인 (text[start:end] == keyword)"""
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        if _is_hangul(keyword[0]):
+            return not _is_hangul(before) or len(keyword) >= HANGUL_COMPOUND_MIN_LEN
+        if _is_word_char(keyword[0]) and _is_word_char(before):
+            return False
+        if _is_word_char(keyword[-1]) and _is_word_char(after):
+            return False
+        return True
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """(시작 위치, 키워드) 목록 (text는 normalize_text 결과)"""
+        hits = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for index in self._out[state]:
+                keyword = self.keywords[index]
+                start = i + 1 - len(keyword)
+                if self._accept(text, start, i + 1, keyword):
+                    hits.append((start, keyword))
+        return hits
+
+    def count(self, text: str) -> Dict[str, int]:
+        """키워드별 등장 횟수 (HTML도 그대로 넘겨도 됨)"""
+        counts: Dict[str, int] = {}
+        for _, keyword in self.find(normalize_text(text)):
+            counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Dict, Any, Optional
+
+DEFAULT_TIMEOUT = 20.0
+
+
+def crawler_name(crawler) -> str:
+    """크롤러 표시 이름 (name 속성이 없으면 클래스 이름)"""
+    return getattr(crawler, "name", None) or type(crawler).__name__
+
+
+def _start_daemon(fn: Callable[..., Any], name: str, slots: threading.Semaphore, **kwargs) -> Future:
+    """
+    daemon 스레드에서 fn 실행
+    ThreadPoolExecutor의 작업 스레드는 인터프리터 종료 시 join되므로, 멈춘 크롤러 하나가
+    프로세스 종료까지 막을 수 있습니다. daemon 스레드는 종료를 막지 않습니다.
+    """
+    future = Future()
+
+    def run():
+        with slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(**kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=run, name=f"crawl-{name}", daemon=True).start()
+    return future
+
+
+def fetch_all(crawlers: List[Any], limit: int = 1,
+              default_timeout: float = DEFAULT_TIMEOUT,
+              max_workers: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    모든 크롤러의 fetch_latest를 동시에 실행하고, 각 소스의 마감 시간 안에
+    끝난 결과만 모아서 반환합니다.
+
+    소스별 타임아웃은 크롤러의 `timeout` 속성(없으면 default_timeout)을 사용합니다.
+    모든 요청이 동시에 시작되므로 전체 소요 시간은 가장 느린 소스 하나 수준입니다.
+    크롤러는 daemon 스레드에서 실행되므로 마감을 넘겨 멈춘 소스가 있어도
+    이 함수와 프로세스 종료가 그 소스를 기다리지 않습니다.
+
+    Returns: {소스 이름: 아이템 리스트} (마감을 넘기거나 실패한 소스는 제외)
+    """
+    if not crawlers:
+        return {}
+
+    slots = threading.Semaphore(max_workers or len(crawlers))
+    started = time.monotonic()
+    jobs = []
+    for crawler in crawlers:
+        timeout = getattr(crawler, "timeout", None) or default_timeout
+        name = crawler_name(crawler)
+        future = _start_daemon(crawler.fetch_latest, name, slots, limit=limit)
+        jobs.append((started + timeout, name, future))
+
+    results = {}
+    # 마감 시간이 빠른 소스부터 기다림 → 총 대기 시간은 가장 긴 마감 시간 이하
+    for deadline, name, future in sorted(jobs, key=lambda job: job[0]):
+        try:
+            items = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            results[name] = items or []
+            print(f"[crawl] {name}: {len(results[name])}개 ({time.monotonic() - started:.1f}s)")
+        except FutureTimeoutError:
+            print(f"[crawl] {name}: 마감 시간 초과 - 건너뜀")
+            # 아직 슬롯을 기다리는 중이면 시작하지 않음 (이미 실행 중인 스레드는 그대로 둠)
+            future.cancel()
+        except Exception as e:
+            print(f"[crawl] {name}: 오류 - {e}")
+
+    return results
@@ -0,0 +1,107 @@
+"""
+점진적 RSS/Atom 파서
+=============================
+응답을 청크 단위로 XMLPullParser에 넣으면서 엔트리를 하나씩 꺼내고,
+필요한 개수(limit)를 채우면 나머지 문서는 내려받지도 파싱하지도 않습니다.
+잘못된 XML 등 빠른 경로로 처리할 수 없는 피드는 feedparser로 넘깁니다.
+"""
+
+import datetime
+import email.utils
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from lxml import etree
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ITEM_TAGS = {"item", "entry"}
+DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+
+class FeedParseError(Exception):
+    """빠른 경로로 파싱할 수 없는 피드"""
+
+
+def _local(tag) -> str:
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_date(value: str) -> Optional[float]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)  # RSS (RFC 822)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))  # Atom (ISO 8601)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def _entry_from_element(elem) -> Dict[str, Any]:
+    entry = {}
+    for child in elem:
+        name = _local(child.tag)
+        if name == "title":
+            entry["title"] = "".join(child.itertext()).strip()
+        elif name == "link":
+            # RSS: <link>URL</link>, Atom: <link rel="alternate" href="URL"/>
+            if child.get("href"):
+                if child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                    entry["link"] = child.get("href")
+            elif child.text:
+                entry["link"] = child.text.strip()
+        elif name in ("description", "summary"):
+            entry["summary"] = "".join(child.itertext()).strip()
+        elif name == "content" and child.tag.startswith("{" + ATOM_NS) and "summary" not in entry:
+            entry["summary"] = "".join(child.itertext()).strip()
+        elif name in DATE_TAGS and "published" not in entry and child.text:
+            entry["published"] = child.text.strip()
+            timestamp = _parse_date(child.text)
+            if timestamp is not None:
+                entry["published_ts"] = timestamp
+    return entry
+
+
+def parse_entries(chunks: Iterable[bytes], limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    피드 청크를 점진적으로 파싱해 제목/링크가 있는 엔트리를 최대 limit개 반환
+
+    Returns: (엔트리 목록, 문서 끝까지 파싱했는지 여부)
+    Raises: FeedParseError (잘못된 XML 또는 엔트리가 없는 문서)
+    """
+    parser = etree.XMLPullParser(events=("end",), resolve_entities=False, no_network=True)
+    entries = []
+
+    def drain() -> bool:
+        for _, elem in parser.read_events():
+            if _local(elem.tag) not in ITEM_TAGS:
+                continue
+            entry = _entry_from_element(elem)
+            if entry.get("title") and entry.get("link"):
+                entries.append(entry)
+            # 처리한 엔트리는 트리에서 제거
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            if limit is not None and len(entries) >= limit:
+                return True
+        return False
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            if drain():
+                return entries, False
+        parser.close()
+        drain()
+    except etree.XMLSyntaxError as e:
+        raise FeedParseError(str(e)) from e
+
+    if not entries:
+        raise FeedParseError("no entries found")
+    return entries, True
@@ -0,0 +1,126 @@
+import calendar
+import hashlib
+import json
+import os
+import feedparser
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from .http import get_session, DEFAULT_TIMEOUT
+from .fast_feed import parse_entries, FeedParseError
+from ..storage import data_path
+
+# 캐시에 저장하는 엔트리 필드
+ENTRY_FIELDS = ("title", "link", "summary", "description", "published", "updated")
+CHUNK_SIZE = 16 * 1024
+
+
+class FeedCache:
+    """
+    RSS 피드 조건부 GET 캐시
+
+    피드 URL마다 ETag / Last-Modified와 파싱된 엔트리를 디스크에 저장하고,
+    다음 요청 때 If-None-Match / If-Modified-Since를 보냅니다.
+    304 응답이면 파싱 없이 저장된 엔트리를 그대로 사용합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else data_path("feeds")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, url: str, record: Dict[str, Any]):
+        path = self._path(url)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def fetch_entries(self, url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        피드 엔트리 목록 반환 (변경이 없으면 캐시 사용)
+
+        limit을 주면 그 개수만큼 엔트리를 얻는 즉시 다운로드/파싱을 멈춥니다.
+        """
+        cached = self.load(url)
+        # 저장된 엔트리가 요청 개수보다 적게 잘려 있으면 조건부 요청을 하지 않음
+        usable = cached and (cached.get("complete", True) or
+                             (limit is not None and len(cached["entries"]) >= limit))
+        headers = {}
+        if usable:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            with get_session().get(url, headers=headers, timeout=DEFAULT_TIMEOUT, stream=True) as resp:
+                if resp.status_code == 304 and usable:
+                    print(f"[feed cache] 변경 없음 (304): {url}")
+                    return cached["entries"]
+                resp.raise_for_status()
+                entries, complete = self._parse_response(url, resp, limit)
+        except Exception as e:
+            print(f"[feed cache] 피드 요청 실패: {url} - {e}")
+            # 네트워크 오류 시 마지막으로 받은 엔트리라도 사용
+            return cached["entries"] if cached else []
+
+        self.save(url, {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "complete": complete,
+            "entries": entries,
+        })
+        return entries
+
+    def _parse_response(self, url: str, resp, limit: Optional[int]):
+        """점진적 파서로 먼저 시도하고, 실패하면 전체 문서를 feedparser로 파싱"""
+        received = []
+
+        def read_chunks():
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                received.append(chunk)
+                yield chunk
+
+        chunks = read_chunks()
+        try:
+            return parse_entries(chunks, limit)
+        except FeedParseError as e:
+            print(f"[feed cache] 빠른 파싱 실패, feedparser 사용: {url} ({e})")
+
+        # 남은 문서까지 모두 받은 뒤 feedparser로 파싱
+        for _ in chunks:
+            pass
+        feed = feedparser.parse(b"".join(received), response_headers={
+            "content-location": url,
+            "content-type": resp.headers.get("Content-Type", ""),
+        })
+        return [_entry_to_dict(entry) for entry in feed.entries], True
+
+
+def _entry_to_dict(entry) -> Dict[str, Any]:
+    """feedparser 엔트리를 JSON으로 저장 가능한 dict로 변환"""
+    data = {field: entry.get(field) for field in ENTRY_FIELDS if entry.get(field)}
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        data["published_ts"] = calendar.timegm(parsed)
+    return data
+
+
+_default_cache = None
+
+
+def fetch_entries(url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """기본 FeedCache로 피드 엔트리 가져오기"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FeedCache()
+    return _default_cache.fetch_entries(url, limit)
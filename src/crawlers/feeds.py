@@ -0,0 +1,48 @@
+"""
+크롤링 대상 피드 레지스트리
+=============================
+새 RSS/Atom 소스는 클래스를 만들 필요 없이 FEEDS에 한 줄 추가하면 됩니다.
+
+FEED_REGISTRY 환경변수에 JSON 파일 경로를 지정하면 FEEDS 대신 그 목록을 사용합니다.
+형식: [{"name": "TechCrunch", "url": "https://...", "weight": 1.0}, ...]
+"""
+
+import json
+import os
+from typing import List, Dict, Any
+from .hacker_news import HackerNewsCrawler
+from .rss import RSSCrawler
+
+# name: 출처 표시 이름, url: 피드 주소, weight: 소스 가중치 (선택), timeout: 크롤링 마감 시간 (선택)
+FEEDS = [
+    {"name": "TechCrunch", "url": "https://techcrunch.com/category/artificial-intelligence/feed/"},
+    {"name": "The Verge", "url": "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml"},
+    {"name": "Wired", "url": "https://www.wired.com/feed/tag/ai/latest/rss"},
+    {"name": "Ars Technica", "url": "https://feeds.arstechnica.com/arstechnica/technology-lab"},
+    {"name": "VentureBeat", "url": "https://venturebeat.com/category/ai/feed/"},
+]
+
+
+def load_feed_registry() -> List[Dict[str, Any]]:
+    """피드 목록 로드 (FEED_REGISTRY 파일이 있으면 우선 사용)"""
+    registry_path = os.getenv("FEED_REGISTRY")
+    if registry_path:
+        try:
+            with open(registry_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[feeds] 레지스트리 로드 실패, 기본 목록 사용: {e}")
+    return FEEDS
+
+
+def build_crawlers() -> List[Any]:
+    """등록된 모든 소스의 크롤러 생성 (Hacker News + 레지스트리의 RSS 피드)"""
+    crawlers = [HackerNewsCrawler()]
+    for feed in load_feed_registry():
+        crawlers.append(RSSCrawler(
+            name=feed["name"],
+            url=feed["url"],
+            weight=feed.get("weight", 1.0),
+            timeout=feed.get("timeout"),
+        ))
+    return crawlers
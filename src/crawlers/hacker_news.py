@@ -1,36 +1,83 @@
-import requests
-from typing import List, Dict, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from .base import BaseCrawler
+from .http import get_session, DEFAULT_TIMEOUT
 import datetime
 
 class HackerNewsCrawler(BaseCrawler):
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
+    name = "Hacker News"
+    weight = 1.0
+
+    # 실행 중 이미 받아온 아이템 (같은 실행 안에서 재요청 방지, 최대 ITEM_CACHE_SIZE개)
+    ITEM_CACHE_SIZE = 500
+    _item_cache: Dict[int, Dict[str, Any]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv("HN_CONCURRENCY", "8"))
+        self.session = get_session()
+
+    def fetch_items(self, story_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        아이템 여러 개를 동시에 가져옴 (공용 keep-alive 세션, 동시 요청 수 제한)
+
+        Returns: {아이템 ID: 아이템 JSON} (실패한 아이템은 제외)
+        """
+        with self._cache_lock:
+            items = {sid: self._item_cache[sid] for sid in story_ids if sid in self._item_cache}
+        missing = [sid for sid in story_ids if sid not in items]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                for sid, item in zip(missing, executor.map(self._fetch_item, missing)):
+                    if item:
+                        items[sid] = item
+
+            with self._cache_lock:
+                for sid in missing:
+                    if sid in items:
+                        self._item_cache[sid] = items[sid]
+                # 오래된 항목부터 제거
+                while len(self._item_cache) > self.ITEM_CACHE_SIZE:
+                    del self._item_cache[next(iter(self._item_cache))]
+        return items
+
+    def _fetch_item(self, sid: int) -> Optional[Dict[str, Any]]:
+        try:
+            item_resp = self.session.get(f"{self.BASE_URL}/item/{sid}.json", timeout=DEFAULT_TIMEOUT)
+            item_resp.raise_for_status()
+            return item_resp.json()
+        except Exception:
+            return None
 
     def fetch_latest(self, limit: int = 5) -> List[Dict[str, Any]]:
         print("Fetching Hacker News top stories...")
         try:
-            resp = requests.get(f"{self.BASE_URL}/topstories.json")
+            resp = self.session.get(f"{self.BASE_URL}/topstories.json", timeout=DEFAULT_TIMEOUT)
             resp.raise_for_status()
             story_ids = resp.json()[:limit*2]
         except Exception as e:
             print(f"Error fetching HN IDs: {e}")
             return []
 
+        items = self.fetch_items(story_ids)
+
         results = []
         for sid in story_ids:
             if len(results) >= limit:
                 break
-            try:
-                item_resp = requests.get(f"{self.BASE_URL}/item/{sid}.json")
-                item = item_resp.json()
-                if item.get('type') == 'story' and 'url' in item:
-                    results.append({
-                        'title': item.get('title'),
-                        'url': item.get('url'),
-                        'original_content': item.get('title'),
-                        'source': 'Hacker News',
-                        'timestamp': datetime.datetime.fromtimestamp(item.get('time', 0)).isoformat()
-                    })
-            except Exception:
-                continue
+            item = items.get(sid)
+            if item and item.get('type') == 'story' and 'url' in item:
+                results.append({
+                    'title': item.get('title'),
+                    'url': item.get('url'),
+                    'original_content': item.get('title'),
+                    'source': 'Hacker News',
+                    'score': item.get('score', 0),
+                    'comments': item.get('descendants', 0),
+                    'timestamp': datetime.datetime.fromtimestamp(item.get('time', 0)).isoformat()
+                })
         return results
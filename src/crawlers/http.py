@@ -0,0 +1,30 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+# 모든 크롤러 요청의 기본 타임아웃 (connect, read)
+DEFAULT_TIMEOUT = (5, 15)
+USER_AGENT = "ai-feed-bot/1.0"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size: int = 16, max_hosts: int = 64) -> requests.Session:
+    """
+    크롤러 공용 HTTP 세션 (keep-alive 커넥션 풀 재사용)
+
+    처음 호출될 때 호스트당 pool_size, 최대 max_hosts개 호스트의 커넥션 풀로 생성되며,
+    이후에는 같은 세션을 반환합니다.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=max_hosts, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = USER_AGENT
+                _session = session
+    return _session
@@ -0,0 +1,55 @@
+import datetime
+from typing import List, Dict, Any, Optional
+from .base import BaseCrawler
+from .feed_cache import fetch_entries
+
+
+class RSSCrawler(BaseCrawler):
+    """
+    피드 레지스트리(feeds.py)의 항목 하나를 담당하는 범용 RSS/Atom 크롤러
+
+    HTTP 요청은 공용 세션 + 조건부 GET 캐시를 거치며,
+    엔트리 정규화는 normalize_entry 한 곳에서만 처리합니다.
+    """
+
+    def __init__(self, name: str, url: str, weight: float = 1.0, timeout: Optional[float] = None):
+        self.name = name
+        self.url = url
+        self.weight = weight
+        self.timeout = timeout
+
+    def fetch_latest(self, limit: int = 5) -> List[Dict[str, Any]]:
+        print(f"Fetching {self.name} feed...")
+        results = []
+        for entry in fetch_entries(self.url, limit):
+            if len(results) >= limit:
+                break
+            item = normalize_entry(entry, self.name)
+            if item:
+                results.append(item)
+        return results
+
+    def __repr__(self) -> str:
+        return f"RSSCrawler({self.name!r}, {self.url!r})"
+
+
+def normalize_entry(entry: Dict[str, Any], source: str) -> Optional[Dict[str, Any]]:
+    """피드 엔트리를 공통 아이템 형식으로 변환 (제목/링크가 없으면 None)"""
+    title = (entry.get("title") or "").strip()
+    url = (entry.get("link") or "").strip()
+    if not title or not url:
+        return None
+
+    # 날짜가 없는 엔트리는 None으로 두어 순위 계산의 기본 나이(반감기)를 적용
+    # (현재 시각으로 채우면 가장 최신 기사로 취급됨)
+    timestamp = None
+    if entry.get("published_ts"):
+        timestamp = datetime.datetime.fromtimestamp(entry["published_ts"]).isoformat()
+
+    return {
+        "title": title,
+        "url": url,
+        "original_content": entry.get("summary") or entry.get("description") or "",
+        "source": source,
+        "timestamp": timestamp,
+    }
@@ -0,0 +1,150 @@
+"""
+재작성 배치 백엔드
+=============================
+ContentProcessor.process_batch가 여러 프롬프트를 한 번에 넘기는 대상입니다.
+generate(prompts)는 프롬프트와 같은 순서로 Generation(텍스트, 토큰 사용량) 또는 예외 객체를
+돌려주므로 한 기사의 실패가 다른 기사에 영향을 주지 않습니다.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from .deadline import Deadline
+
+
+class Generation(NamedTuple):
+    text: str
+    usage: Dict[str, int]
+
+
+Result = Union[Generation, Exception]
+
+BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+def token_usage(response) -> Dict[str, int]:
+    """응답의 토큰 사용량 (입력, 캐시된 입력, 출력)"""
+    usage = getattr(response, "usage_metadata", None)
+    return {
+        "input_tokens": (usage and usage.prompt_token_count) or 0,
+        "cached_input_tokens": (usage and usage.cached_content_token_count) or 0,
+        "output_tokens": (usage and usage.candidates_token_count) or 0,
+    }
+
+
+class GeminiBatchBackend:
+    """
+    Gemini 배치 작업(inline requests)으로 여러 재작성을 한 번에 제출
+
+    배치 작업이 제한 시간 안에 끝나지 않거나 생성에 실패하면 작업을 취소하고
+    남은 프롬프트를 동시 개별 요청으로 처리합니다. (요청마다 request_timeout초 제한)
+    """
+
+    def __init__(self, client, model: str, config: Optional[Dict] = None, poll_interval: float = 10.0,
+                 timeout: Optional[float] = None, max_workers: Optional[int] = None,
+                 request_timeout: Optional[float] = None):
+        self.client = client
+        self.model = model
+        self.config = config  # 요청마다 적용할 GenerateContentConfig (system instruction 등)
+        self.poll_interval = poll_interval
+        self.timeout = timeout or float(os.getenv("GEMINI_BATCH_TIMEOUT", "600"))
+        self.max_workers = max_workers or int(os.getenv("GEMINI_BATCH_FALLBACK_CONCURRENCY", "4"))
+        self.request_timeout = request_timeout
+
+    def generate(self, prompts: List[str]) -> List[Result]:
+        if not prompts:
+            return []
+        try:
+            results = self._run_batch_job(prompts)
+        except Exception as e:
+            print(f"[batch] 배치 작업 실패, 개별 요청으로 전환: {e}")
+            results = [None] * len(prompts)
+
+        # 배치에서 결과를 얻지 못한 프롬프트만 개별 요청
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                for i, result in zip(pending, executor.map(self._generate_one, [prompts[i] for i in pending])):
+                    results[i] = result
+        return results
+
+    def _inline_request(self, prompt: str) -> Dict:
+        request = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if self.config:
+            request["config"] = self.config
+        return request
+
+    def _run_batch_job(self, prompts: List[str]) -> List[Union[Result, None]]:
+        job = self.client.batches.create(
+            model=self.model,
+            src=[self._inline_request(prompt) for prompt in prompts],
+            config={"display_name": f"ai-feed-rewrite-{int(time.time())}"},
+        )
+        print(f"[batch] 배치 작업 생성: {job.name} ({len(prompts)}개)")
+
+        deadline = time.monotonic() + self.timeout
+        while job.state.name not in BATCH_DONE_STATES:
+            if time.monotonic() > deadline:
+                self.client.batches.cancel(name=job.name)
+                raise TimeoutError(f"batch job {job.name} did not finish in {self.timeout:.0f}s")
+            time.sleep(self.poll_interval)
+            job = self.client.batches.get(name=job.name)
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"batch job {job.name} ended with {job.state.name}")
+
+        results = []
+        for inlined in job.dest.inlined_responses or []:
+            if inlined.error:
+                results.append(RuntimeError(inlined.error.message or f"code {inlined.error.code}"))
+            elif inlined.response and inlined.response.text:
+                results.append(Generation(inlined.response.text, token_usage(inlined.response)))
+            else:
+                results.append(None)
+        results.extend([None] * (len(prompts) - len(results)))
+        return results
+
+    def _generate_one(self, prompt: str) -> Result:
+        try:
+            kwargs = {"deadline": Deadline(self.request_timeout)} if self.request_timeout else {}
+            response = self.client.models.generate_content(model=self.model, contents=[prompt],
+                                                           config=self.config, **kwargs)
+            if not response.text:
+                return RuntimeError("empty response")
+            return Generation(response.text, token_usage(response))
+        except Exception as e:
+            return e
+
+
+class LocalBackend:
+    """
+    오프라인 대체 백엔드 (API 키 없이 배치 경로 테스트용)
+
+    프롬프트의 원문 제목으로 출력 형식(TITLE/META/ALT/TAGS + HTML 본문)을 흉내 낸 응답을 만듭니다.
+    fail_on에 포함된 문자열이 프롬프트에 있으면 해당 항목만 예외를 돌려줍니다.
+    """
+
+    def __init__(self, fail_on: Optional[List[str]] = None):
+        self.fail_on = fail_on or []
+
+    def generate(self, prompts: List[str]) -> List[Result]:
+        return [self._generate_one(prompt) for prompt in prompts]
+
+    def _generate_one(self, prompt: str) -> Result:
+        if any(marker in prompt for marker in self.fail_on):
+            return RuntimeError("local backend: simulated failure")
+        match = re.search(r"제목:\s*(.+)", prompt)
+        title = match.group(1).strip() if match else "AI 뉴스"
+        text = "\n".join([
+            f"TITLE: {title}",
+            f"META: {title} 요약",
+            f"ALT: {title} 관련 이미지",
+            "TAGS: AI, 테크뉴스, 인공지능",
+            f"<h2>{title}</h2>",
+            f"<p>{title}에 대한 로컬 테스트 본문입니다.</p>",
+        ])
+        return Generation(text, {"input_tokens": len(prompt) // 4, "cached_input_tokens": 0,
+                                 "output_tokens": len(text) // 4})
@@ -0,0 +1,122 @@
+"""
+프롬프트 입력 압축
+=============================
+RSS 요약 HTML이나 추출한 본문을 프롬프트에 넣기 전에 정리합니다.
+
+1. script/style 제거, 태그 제거, HTML 엔티티 복원
+2. 피드 상용구 줄 제거 ("The post X appeared first on Y", "Continue reading" 등)
+3. 정규화했을 때 같은 문장 중복 제거
+4. 토큰 예산(PROMPT_TOKEN_BUDGET)을 넘으면 정보량이 많은 문장만 남기고 원래 순서대로 이어 붙임
+   정보량 = 문장 단어들의 문서 내 빈도 합 / √단어 수 (흔한 단어 제외), 앞쪽 문장일수록 가중
+"""
+
+import html
+import math
+import os
+import re
+from collections import Counter
+from typing import List, Optional
+
+_BLOCK_RE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_BREAK_RE = re.compile(r"<\s*(br|/p|/div|/li|/h[1-6]|/blockquote)\b[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+(?=[\"'“‘(\[A-Z0-9가-힣])")
+_WORD_RE = re.compile(r"[a-z0-9가-힣]+")
+
+# 피드/기사 상용구 (문장 단위로 일치하면 제거)
+BOILERPLATE_PATTERNS = [
+    r"^the post .+ appeared first on .+$",
+    r"^(continue reading|read more|read the full (story|article)|click here)\b.*$",
+    r"^article url:.*$",
+    r"^comments url:.*$",
+    r"^points: \d+.*$",
+    r"^# comments: \d+.*$",
+    r"^(subscribe|sign up)\b.*(newsletter|updates|inbox).*$",
+    r"^(photo|image|illustration)( by|:| credit).*$",
+    r"^(advertisement|sponsored)$",
+    r"^\[?(…|\.\.\.)\]?$",
+]
+_BOILERPLATE_RE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# 정보량 계산에서 제외할 흔한 단어
+STOPWORDS = {
+    "the", "a", "an", "and", "or", "but", "of", "to", "in", "on", "for", "with", "at", "by", "from",
+    "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "as", "has", "have", "had",
+    "will", "would", "can", "could", "we", "you", "they", "he", "she", "i", "not", "so", "if", "about",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (영문 4자 ≈ 1토큰, 한글 등 비ASCII 1.5자 ≈ 1토큰)"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return math.ceil((len(text) - non_ascii) / 4 + non_ascii / 1.5)
+
+
+def clean_text(text: str) -> str:
+    """마크업 제거 후 줄 단위 텍스트 (연속 공백 정리)"""
+    text = _BLOCK_RE.sub(" ", text or "")
+    text = _BREAK_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub(" ", text))
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def split_sentences(text: str) -> List[str]:
+    sentences = []
+    for line in text.splitlines():
+        sentences.extend(s.strip() for s in _SENTENCE_RE.split(line) if s.strip())
+    return sentences
+
+
+class PromptCompressor:
+    """
+    원문 내용 정리 + 토큰 예산 안으로 축약
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, lead_bonus: float = 0.5):
+        self.token_budget = token_budget or int(os.getenv("PROMPT_TOKEN_BUDGET", "2000"))
+        self.lead_bonus = lead_bonus  # 첫 문장에 주는 가산점 (뒤로 갈수록 감소)
+
+    def compress(self, text: str) -> str:
+        sentences = self._unique_sentences(clean_text(text))
+        if estimate_tokens(" ".join(sentences)) <= self.token_budget:
+            return " ".join(sentences)
+        return " ".join(self._select(sentences))
+
+    def _unique_sentences(self, text: str) -> List[str]:
+        """상용구와 중복 문장 제거"""
+        seen = set()
+        unique = []
+        for sentence in split_sentences(text):
+            if _BOILERPLATE_RE.match(sentence):
+                continue
+            key = " ".join(_WORD_RE.findall(sentence.lower()))
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            unique.append(sentence)
+        return unique
+
+    def _select(self, sentences: List[str]) -> List[str]:
+        """정보량 높은 문장부터 예산이 찰 때까지 고르고 원래 순서로 반환"""
+        words = [[w for w in _WORD_RE.findall(s.lower()) if w not in STOPWORDS] for s in sentences]
+        freq = Counter(w for sentence_words in words for w in set(sentence_words))
+        total = sum(freq.values()) or 1
+
+        scores = []
+        for i, sentence_words in enumerate(words):
+            density = sum(freq[w] for w in sentence_words) / total / math.sqrt(len(sentence_words) or 1)
+            scores.append(density * (1 + self.lead_bonus / (i + 1)))
+
+        chosen, used = [], 0
+        for i in sorted(range(len(sentences)), key=lambda i: -scores[i]):
+            cost = estimate_tokens(sentences[i]) + 1
+            if used + cost > self.token_budget:
+                continue
+            chosen.append(i)
+            used += cost
+        if not chosen:
+            # 문장 하나가 예산보다 길면 가장 정보량 높은 문장을 잘라서 사용
+            best = sentences[max(range(len(sentences)), key=lambda i: scores[i])]
+            return [best[:self.token_budget * 2]]
+        return [sentences[i] for i in sorted(chosen)]
@@ -0,0 +1,78 @@
+"""
+기사별 시간 예산
+=============================
+Deadline은 기사 하나에 주어진 시간 예산이고, child(비율)로 단계별(재작성, 이미지) 예산을 나눕니다.
+자식 마감은 부모 마감을 넘지 않으므로 어느 단계에서든 전체 예산을 초과하지 않습니다.
+
+LatencyTracker는 호출 종류별 최근 응답 시간을 모아 p95를 계산합니다.
+실행마다 기사 수가 적어서 샘플이 잘 쌓이지 않으므로 PersistentCache에 저장해 다음 실행에서도 씁니다.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..storage import PersistentCache
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Deadline:
+    def __init__(self, seconds: float, parent: Optional["Deadline"] = None):
+        self.expires_at = time.monotonic() + max(0.0, seconds)
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def child(self, share: float) -> "Deadline":
+        """남은 시간의 share 비율만 쓰는 하위 단계 마감"""
+        return Deadline(self.remaining() * share, parent=self)
+
+    def check(self, stage: str):
+        if self.expired:
+            raise DeadlineExceeded(f"{stage}: 시간 예산 초과")
+
+
+class LatencyTracker:
+    """
+    종류별 최근 응답 시간(초) 기록과 백분위 계산
+
+    샘플이 min_samples개 미만이면 percentile()은 None을 돌려줍니다. (헤징하지 않음)
+    """
+
+    def __init__(self, store: Optional[PersistentCache] = None, window: int = 200, min_samples: int = 20):
+        self.store = store
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> List[float]:
+        if key not in self._samples:
+            self._samples[key] = (self.store.get(key) if self.store else None) or []
+        return self._samples[key]
+
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            samples = self._load(key)
+            samples.append(round(seconds, 3))
+            del samples[:-self.window]
+            if self.store:
+                self.store.set(key, samples)
+
+    def percentile(self, key: str, q: float = 95) -> Optional[float]:
+        with self._lock:
+            samples = self._load(key)
+            if len(samples) < self.min_samples:
+                return None
+            return float(np.percentile(samples, q))
@@ -0,0 +1,212 @@
+"""
+교차 소스 유사 기사 탐지 (MinHash + LSH banding)
+=============================
+같은 발표가 여러 매체에 동시에 올라오면 한 번만 재작성/발행하도록
+제목의 단어 집합으로 MinHash 서명을 만들고 LSH 밴드 인덱스로 후보를 찾습니다.
+
+- 제목만 쓰는 이유: HN처럼 제목만 있는 소스도 있고, 매체마다 요약 길이가 달라
+  본문까지 넣으면 같은 기사끼리도 단어 집합 크기가 크게 달라집니다.
+- 후보는 포함도(작은 쪽 단어 중 겹치는 비율)로 확인합니다. 같은 발표를 다룬 제목은
+  표현이 달라도 짧은 쪽 제목의 핵심 단어가 대부분 긴 쪽에 들어 있습니다.
+  ("OpenAI releases GPT-5" ⊂ "OpenAI launches GPT-5, its new flagship AI model" → 0.67)
+- "GPT-5" 한 단어만 겹치는 다른 기사를 묶지 않도록 MIN_SHARED_TOKENS개 이상 겹쳐야 합니다.
+"""
+
+import hashlib
+import re
+import sqlite3
+import struct
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+
+NUM_PERM = 128
+BANDS = 64  # 밴드당 2행 → 단어 Jaccard 0.2인 쌍도 약 93% 확률로 후보 (확인은 포함도로)
+DEFAULT_THRESHOLD = 0.4
+MIN_SHARED_TOKENS = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 고정 시드로 만든 해시 순열 계수 (실행 간 서명이 호환되도록 결정적으로 생성)
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(b"a%d" % i, digest_size=8).digest(), "big") % _MERSENNE_PRIME | 1,
+     int.from_bytes(hashlib.blake2b(b"b%d" % i, digest_size=8).digest(), "big") % _MERSENNE_PRIME)
+    for i in range(NUM_PERM)
+]
+
+_TAG_RE = re.compile(r"<[^>]+>")
+# "gpt-5", "o3-mini", "2.5" 같은 모델/버전 이름은 한 단어로
+_WORD_RE = re.compile(r"[^\W_]+(?:[-.][^\W_]+)*")
+# launches/launched/launch → launch 정도의 가벼운 어미 정리
+_SUFFIX_RE = re.compile(r"(?:ing|ed|es|e|s)$")
+STOPWORDS = {
+    "the", "and", "for", "that", "with", "this", "from", "are", "was", "its", "has", "have",
+    "will", "but", "not", "you", "your", "our", "their", "they", "about", "into", "than",
+    "been", "more", "after", "over", "new", "says", "said", "post", "appeared", "first",
+    "here", "now", "just", "how", "why", "what", "who", "all", "can", "out", "his", "her",
+}
+
+
+class Signature(NamedTuple):
+    minhash: array
+    tokens: frozenset
+
+
+def _tokens(text: str) -> frozenset:
+    """제목 단어 집합 (불용어 제외, 숫자가 없는 단어는 세 글자 이상만, 어미 정리)"""
+    tokens = set()
+    for word in _WORD_RE.findall(_TAG_RE.sub(" ", text or "").lower()):
+        if word in STOPWORDS:
+            continue
+        if not any(ch.isdigit() for ch in word):
+            if len(word) <= 2:
+                continue
+            if len(word) > 4:
+                word = _SUFFIX_RE.sub("", word)
+        tokens.add(word)
+    return frozenset(tokens)
+
+
+def minhash_signature(text: str) -> Signature:
+    """텍스트의 MinHash 서명 (32비트 정수 NUM_PERM개)과 단어 집합"""
+    tokens = _tokens(text)
+    hashes = [int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest(), "big")
+              for t in tokens]
+    if not hashes:
+        return Signature(array("I", [_MAX_HASH] * NUM_PERM), tokens)
+    return Signature(array("I", [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]), tokens)
+
+
+def item_signature(item: Dict[str, Any]) -> Signature:
+    """아이템 제목으로 서명 생성 (소스마다 요약 유무/길이가 달라 본문은 쓰지 않음)"""
+    return minhash_signature(item.get("title") or "")
+
+
+def similarity(tokens_a: frozenset, tokens_b: frozenset) -> float:
+    """포함도 |A∩B| / min(|A|, |B|) (겹치는 단어가 MIN_SHARED_TOKENS개 미만이면 0)"""
+    shared = len(tokens_a & tokens_b)
+    if shared < MIN_SHARED_TOKENS:
+        return 0.0
+    return shared / min(len(tokens_a), len(tokens_b))
+
+
+def _band_buckets(sig: array) -> List[Tuple[int, int]]:
+    rows = len(sig) // BANDS
+    buckets = []
+    for band in range(BANDS):
+        chunk = sig[band * rows:(band + 1) * rows].tobytes()
+        bucket = struct.unpack("<q", hashlib.blake2b(chunk, digest_size=8).digest())[0]
+        buckets.append((band, bucket))
+    return buckets
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명 LSH 인덱스 (SQLite)
+    밴드가 겹치는 후보만 꺼내 저장해 둔 단어 집합으로 포함도를 계산합니다.
+
+    db_path가 없으면 메모리에만 유지되고(실행 내 클러스터링용),
+    있으면 과거 실행에서 발행한 기사 서명을 보관하는 히스토리로 사용됩니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path) if db_path else ":memory:", check_same_thread=False)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(signatures)")}
+        if columns and "tokens" not in columns:
+            # 제목+요약 서명을 쓰던 예전 기록은 새 서명과 비교할 수 없으므로 비움
+            self.conn.executescript("DROP TABLE signatures; DROP TABLE IF EXISTS bands;")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS signatures (
+                key TEXT PRIMARY KEY,
+                sig BLOB NOT NULL,
+                tokens TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                key TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_bands_bucket ON bands (band, bucket);
+            CREATE INDEX IF NOT EXISTS idx_bands_key ON bands (key);
+        """)
+
+    def add(self, key: str, sig: Signature):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM bands WHERE key = ?", (key,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO signatures (key, sig, tokens, created_at) VALUES (?, ?, ?, ?)",
+                (key, sig.minhash.tobytes(), " ".join(sorted(sig.tokens)), time.time()),
+            )
+            self.conn.executemany(
+                "INSERT INTO bands (band, bucket, key) VALUES (?, ?, ?)",
+                [(band, bucket, key) for band, bucket in _band_buckets(sig.minhash)],
+            )
+
+    def _candidates(self, sig: Signature) -> List[Tuple[str, float]]:
+        """LSH 밴드가 하나 이상 겹치는 (키, 포함도) 목록"""
+        buckets = _band_buckets(sig.minhash)
+        where = " OR ".join(["(b.band = ? AND b.bucket = ?)"] * len(buckets))
+        params = [value for pair in buckets for value in pair]
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT DISTINCT s.key, s.tokens FROM bands b JOIN signatures s ON s.key = b.key WHERE {where}",
+                params,
+            ).fetchall()
+        return [(key, similarity(sig.tokens, frozenset(tokens.split()))) for key, tokens in rows]
+
+    def query(self, sig: Signature) -> List[Tuple[str, float]]:
+        """임계값 이상으로 유사한 (키, 유사도) 목록, 유사도 내림차순"""
+        matches = [match for match in self._candidates(sig) if match[1] >= self.threshold]
+        return sorted(matches, key=lambda match: -match[1])
+
+    def max_similarity(self, sig: Signature) -> float:
+        """인덱스 안에서 가장 비슷한 서명과의 유사도 (후보가 없으면 0)"""
+        return max((similarity for _, similarity in self._candidates(sig)), default=0.0)
+
+    def prune(self, ttl_days: float) -> int:
+        """ttl_days보다 오래된 서명 삭제"""
+        cutoff = time.time() - ttl_days * 86400
+        with self._lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM bands WHERE key IN (SELECT key FROM signatures WHERE created_at < ?)", (cutoff,)
+            )
+            cursor = self.conn.execute("DELETE FROM signatures WHERE created_at < ?", (cutoff,))
+        return cursor.rowcount
+
+
+def dedupe_items(items: List[Dict[str, Any]], history: Optional[NearDuplicateIndex] = None,
+                 threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    후보 아이템을 유사 기사끼리 묶어 클러스터당 대표 1개만 남깁니다.
+
+    - 원문 내용이 가장 긴 아이템을 대표로 선택 (재작성 입력이 풍부하도록)
+    - history에 이미 비슷한 기사가 있으면 클러스터 전체를 제외
+    - 반환 순서는 입력 순서를 유지
+    """
+    run_index = NearDuplicateIndex(threshold=threshold)
+    order = sorted(range(len(items)), key=lambda i: -len(items[i].get("original_content") or ""))
+
+    keep = set()
+    for i in order:
+        item = items[i]
+        sig = item_signature(item)
+        if history is not None and history.query(sig):
+            print(f"[dedup] 이전에 발행한 기사와 유사: {item.get('title')}")
+            continue
+        duplicates = run_index.query(sig)
+        if duplicates:
+            print(f"[dedup] 유사 기사 제외: {item.get('title')} (≈ {duplicates[0][0]}, {duplicates[0][1]:.2f})")
+            continue
+        run_index.add(item.get("url") or str(i), sig)
+        keep.add(i)
+
+    return [item for i, item in enumerate(items) if i in keep]
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from lxml import etree
+from ..crawlers.http import get_session, DEFAULT_TIMEOUT
+
+# 본문으로 보지 않는 영역
+SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure", "svg", "button"}
+# 본문 텍스트로 수집하는 블록
+TEXT_TAGS = {"p", "h2", "h3", "li", "blockquote"}
+MIN_BLOCK_CHARS = 40
+CHUNK_SIZE = 64 * 1024
+
+
+class ArticleExtractor:
+    """
+    원문 기사 본문 추출기
+
+    기사 URL을 스트리밍으로 받으면서 lxml HTMLPullParser로 점진적으로 파싱하고,
+    다운로드 크기(max_bytes)와 추출 글자 수(max_chars)에 상한을 둬서
+    아주 큰 페이지에서도 메모리 사용량이 일정하게 유지됩니다.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, max_chars: Optional[int] = None,
+                 max_workers: Optional[int] = None):
+        self.max_bytes = max_bytes or int(os.getenv("ARTICLE_MAX_BYTES", str(2 * 1024 * 1024)))
+        self.max_chars = max_chars or int(os.getenv("ARTICLE_MAX_CHARS", "20000"))
+        self.max_workers = max_workers or int(os.getenv("EXTRACT_CONCURRENCY", "4"))
+
+    def extract(self, url: str) -> str:
+        """기사 본문 텍스트 반환 (실패 시 빈 문자열)"""
+        try:
+            with get_session().get(url, stream=True, timeout=DEFAULT_TIMEOUT) as resp:
+                resp.raise_for_status()
+                content_type = resp.headers.get("Content-Type", "")
+                if "html" not in content_type:
+                    return ""
+                encoding = resp.encoding if "charset" in content_type.lower() else None
+                return self._parse_stream(resp.iter_content(CHUNK_SIZE), encoding)
+        except Exception as e:
+            print(f"[extract] 본문 추출 실패: {url} - {e}")
+            return ""
+
+    def _parse_stream(self, chunks, encoding: Optional[str] = None) -> str:
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+        article_blocks, other_blocks = [], []
+        state = {"skip": 0, "capture": 0, "article": 0, "chars": 0}
+
+        received = 0
+        for chunk in chunks:
+            received += len(chunk)
+            parser.feed(chunk)
+            self._drain(parser, state, article_blocks, other_blocks)
+            if received >= self.max_bytes or state["chars"] >= self.max_chars:
+                break
+        else:
+            try:
+                parser.close()
+            except etree.LxmlError:
+                pass
+            self._drain(parser, state, article_blocks, other_blocks)
+
+        # <article> 안의 문단이 있으면 그것만, 없으면 페이지 전체 문단 사용
+        blocks = article_blocks or other_blocks
+        return "\n\n".join(blocks)[:self.max_chars]
+
+    def _drain(self, parser, state, article_blocks, other_blocks):
+        for event, elem in parser.read_events():
+            tag = elem.tag if isinstance(elem.tag, str) else ""
+            if event == "start":
+                if tag in SKIP_TAGS:
+                    state["skip"] += 1
+                elif tag == "article":
+                    state["article"] += 1
+                elif tag in TEXT_TAGS:
+                    state["capture"] += 1
+                continue
+
+            if tag in SKIP_TAGS:
+                state["skip"] -= 1
+            elif tag == "article":
+                state["article"] -= 1
+            elif tag in TEXT_TAGS:
+                state["capture"] -= 1
+                if not state["skip"] and not state["capture"]:
+                    text = " ".join("".join(elem.itertext()).split())
+                    if len(text) >= MIN_BLOCK_CHARS:
+                        (article_blocks if state["article"] else other_blocks).append(text)
+                        state["chars"] += len(text)
+
+            # 수집 중인 블록 밖이면 처리가 끝난 요소를 비워 메모리 유지
+            if not state["capture"]:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    def extract_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 아이템의 원문을 동시에 추출해 original_content를 교체합니다.
+        추출한 본문이 기존 요약보다 짧으면 기존 내용을 유지합니다.
+        """
+        if not items:
+            return items
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            texts = list(executor.map(lambda item: self.extract(item["url"]), items))
+
+        for item, text in zip(items, texts):
+            if len(text) > len(item.get("original_content") or ""):
+                print(f"[extract] 본문 추출: {item['title'][:40]}... ({len(text)}자)")
+                item["summary"] = item.get("original_content", "")
+                item["original_content"] = text
+        return items
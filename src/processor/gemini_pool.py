@@ -0,0 +1,339 @@
+"""
+공유 Gemini 클라이언트 (속도 제한 + 재시도)
+=============================
+ContentProcessor와 ImageGenerator가 같은 genai.Client와 같은 한도를 나눠 씁니다.
+
+- 분당 요청 수(GEMINI_RPM)와 분당 토큰 수(GEMINI_TPM) 토큰 버킷
+- 동시 요청 수 제한(GEMINI_MAX_CONCURRENCY)
+- 429/5xx는 retry-after(헤더 또는 RetryInfo.retryDelay)를 우선 따르고,
+  없으면 지터를 섞은 지수 백오프로 재시도(GEMINI_MAX_RETRIES)
+- deadline을 넘기면 남은 시간을 요청별 HTTP 타임아웃으로 걸고, 응답이 그 종류의
+  p95보다 늦어지면 같은 요청을 한 번 더 보내(헤징) 먼저 온 응답을 사용(GEMINI_HEDGE)
+  (한도 대기도 deadline 안에서만 하고, 기다리는 사이 마감이 지났거나 다른 응답이 먼저 오면 보내지 않음)
+
+get_gemini_client()가 돌려주는 객체는 genai.Client처럼 쓸 수 있습니다.
+models.generate_content / generate_content_stream만 한도를 거치고,
+caches, batches 등 나머지 속성은 원래 클라이언트로 그대로 넘깁니다.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Iterator, Optional
+
+from google import genai
+from google.genai import errors, types
+
+from .deadline import Deadline, DeadlineExceeded, LatencyTracker
+from ..storage import PersistentCache, data_path
+
+RETRYABLE_CODES = {429, 500, 502, 503, 504}
+
+_instance = None
+_instance_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    분당 한도를 초 단위로 채우는 토큰 버킷
+
+    acquire()는 필요한 만큼 채워질 때까지 기다립니다. (deadline 안에 채워지지 않으면 기다리지 않고 DeadlineExceeded)
+    실제 사용량이 추정보다 많으면 adjust()로 잔량을 음수까지 깎아 다음 요청을 늦춥니다.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1.0, deadline: Optional[Deadline] = None):
+        # 한 번에 버킷 용량보다 많이 요청하면 가득 찬 상태에서 보내도록 제한
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            if deadline is not None and wait >= deadline.remaining():
+                raise DeadlineExceeded("속도 제한 대기가 시간 예산을 넘김")
+            time.sleep(wait)
+
+    def adjust(self, amount: float):
+        """추정치와 실제 사용량의 차이 반영 (양수면 추가 차감)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens - amount)
+
+
+def _estimate_tokens(contents: Any) -> int:
+    """요청 입력 토큰 대략 추정 (문자 4개 ≈ 1토큰)"""
+    if isinstance(contents, str):
+        return len(contents) // 4 + 1
+    if isinstance(contents, (list, tuple)):
+        return sum(_estimate_tokens(part) for part in contents)
+    return 1
+
+
+def _used_tokens(response) -> Optional[int]:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    return usage.total_token_count or ((usage.prompt_token_count or 0) + (usage.candidates_token_count or 0))
+
+
+def _retry_after(error: errors.APIError) -> Optional[float]:
+    """서버가 알려준 재시도 대기 시간(초)"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") if hasattr(headers, "get") else None
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+    # google.rpc.RetryInfo {"retryDelay": "12s"}
+    details = error.details.get("error", error.details) if isinstance(error.details, dict) else {}
+    for detail in details.get("details") or []:
+        if isinstance(detail, dict) and "retryDelay" in detail:
+            match = re.match(r"([\d.]+)s", str(detail["retryDelay"]))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+def _with_timeout(config: Any, seconds: float) -> Any:
+    """요청 설정에 HTTP 타임아웃(ms) 적용 (dict 또는 GenerateContentConfig)"""
+    timeout_ms = max(1000, int(seconds * 1000))
+    if config is None:
+        return {"http_options": {"timeout": timeout_ms}}
+    if isinstance(config, dict):
+        return {**config, "http_options": {**(config.get("http_options") or {}), "timeout": timeout_ms}}
+    return config.model_copy(update={"http_options": types.HttpOptions(timeout=timeout_ms)})
+
+
+class _RateLimitedModels:
+    def __init__(self, pool: "GeminiClientPool"):
+        self._pool = pool
+
+    def generate_content(self, *, deadline: Optional[Deadline] = None, latency_key: Optional[str] = None, **kwargs):
+        return self._pool.call(self._pool.client.models.generate_content, kwargs, deadline, latency_key)
+
+    def generate_content_stream(self, *, deadline: Optional[Deadline] = None, **kwargs) -> Iterator:
+        return self._pool.stream(kwargs, deadline)
+
+    def __getattr__(self, name):
+        return getattr(self._pool.client.models, name)
+
+
+class GeminiClientPool:
+    """
+    속도 제한과 재시도를 적용한 genai.Client 래퍼
+    """
+
+    def __init__(self, api_key: str, rpm: Optional[float] = None, tpm: Optional[float] = None,
+                 max_concurrency: Optional[int] = None, max_retries: Optional[int] = None):
+        self.client = genai.Client(api_key=api_key)
+        self.requests = TokenBucket(rpm or float(os.getenv("GEMINI_RPM", "15")))
+        self.tokens = TokenBucket(tpm or float(os.getenv("GEMINI_TPM", "1000000")))
+        max_concurrency = max_concurrency or int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("GEMINI_MAX_RETRIES", "5"))
+        self.base_delay = float(os.getenv("GEMINI_BACKOFF_BASE", "1.0"))
+        self.max_delay = float(os.getenv("GEMINI_BACKOFF_MAX", "60"))
+        self.models = _RateLimitedModels(self)
+
+        # 헤징: 종류별 p95 응답 시간을 넘기면 중복 요청 1회
+        self.hedge = os.getenv("GEMINI_HEDGE", "true").lower() in ("1", "true", "yes")
+        self.latency = LatencyTracker(PersistentCache(data_path("gemini_latency.sqlite3"), max_entries=100))
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency * 2, thread_name_prefix="gemini")
+
+    def __getattr__(self, name):
+        # caches, batches, files 등은 원래 클라이언트 그대로 사용
+        return getattr(self.client, name)
+
+    def _backoff(self, attempt: int, error: errors.APIError) -> float:
+        delay = _retry_after(error)
+        if delay is None:
+            # full jitter: 0 ~ base × 2^attempt
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return min(delay, self.max_delay)
+
+    def _acquire(self, kwargs, deadline: Optional[Deadline] = None) -> int:
+        estimate = _estimate_tokens(kwargs.get("contents"))
+        self.requests.acquire(1, deadline)
+        try:
+            self.tokens.acquire(estimate, deadline)
+        except DeadlineExceeded:
+            self.requests.adjust(-1)
+            raise
+        return estimate
+
+    def _release(self, estimate: int):
+        """받아 두고 보내지 않은 요청의 한도 반환"""
+        self.requests.adjust(-1)
+        self.tokens.adjust(-estimate)
+
+    def _reserve(self, kwargs, deadline: Optional[Deadline], cancelled: Optional[threading.Event], key: str):
+        """
+        한도와 동시 실행 슬롯을 확보하고 실제로 보낼 요청 인자 반환 (슬롯은 호출한 쪽에서 release)
+
+        기다리는 동안 마감이 지나거나 호출한 쪽이 포기(cancelled)하면 받은 한도를 돌려주고
+        DeadlineExceeded를 발생시킵니다. HTTP 타임아웃은 기다린 뒤 남은 시간으로 계산합니다.
+        """
+        if deadline is not None:
+            deadline.check(key)
+        estimate = self._acquire(kwargs, deadline)
+        if not self.slots.acquire(timeout=deadline.remaining() if deadline is not None else None):
+            self._release(estimate)
+            raise DeadlineExceeded(f"{key}: 시간 예산 초과")
+        if (cancelled is not None and cancelled.is_set()) or (deadline is not None and deadline.expired):
+            self.slots.release()
+            self._release(estimate)
+            raise DeadlineExceeded(f"{key}: 요청 전에 취소됨")
+        if deadline is not None:
+            kwargs = {**kwargs, "config": _with_timeout(kwargs.get("config"), deadline.remaining())}
+        return kwargs, estimate
+
+    def call(self, method, kwargs, deadline: Optional[Deadline] = None, latency_key: Optional[str] = None):
+        """
+        한도 안에서 요청 (deadline이 있으면 그 안에 응답이 없을 때 DeadlineExceeded)
+
+        응답이 latency_key(기본: 모델 이름)의 p95보다 늦으면 같은 요청을 한 번 더 보내고
+        둘 중 먼저 성공한 응답을 돌려줍니다.
+        시간 예산 안에 응답이 없으면 기다린 시간도 응답 시간으로 기록합니다.
+        (느린 호출이 빠지면 p95가 실제보다 낮아져 헤징이 너무 일찍 나감)
+        """
+        key = latency_key or kwargs.get("model") or "default"
+        if deadline is None:
+            return self._call_with_retry(method, kwargs, None, key)
+
+        # 응답을 받았거나 기다림을 포기하면 설정해서, 아직 한도를 기다리는 요청은 보내지 않게 함
+        cancelled = threading.Event()
+        started = time.monotonic()
+        try:
+            pending = {self._executor.submit(self._call_with_retry, method, kwargs, deadline, key, cancelled)}
+            done = set()
+            hedge_after = self.latency.percentile(key) if self.hedge else None
+            if hedge_after is not None and hedge_after < deadline.remaining():
+                done, pending = wait(pending, timeout=hedge_after)
+                if not done:
+                    print(f"[Gemini] {key} 응답이 p95({hedge_after:.1f}초)보다 늦어 중복 요청 전송")
+                    pending.add(self._executor.submit(self._call_with_retry, method, kwargs, deadline, key,
+                                                      cancelled))
+
+            error = None
+            while True:
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = future.exception()
+                if not pending:
+                    if deadline.expired:
+                        # 요청별 HTTP 타임아웃(남은 시간)으로 실패한 경우
+                        self.latency.record(key, time.monotonic() - started)
+                    raise error
+                done, pending = wait(pending, timeout=deadline.remaining(), return_when=FIRST_COMPLETED)
+                if not done:
+                    self.latency.record(key, time.monotonic() - started)
+                    raise DeadlineExceeded(f"{key}: 시간 예산 초과")
+        finally:
+            cancelled.set()
+
+    def _call_with_retry(self, method, kwargs, deadline: Optional[Deadline], key: str,
+                         cancelled: Optional[threading.Event] = None):
+        """재시도 가능한 오류면 백오프 후 다시 시도 (성공한 호출의 응답 시간 기록)"""
+        cancelled = cancelled or threading.Event()
+        attempt = 0
+        while True:
+            call_kwargs, estimate = self._reserve(kwargs, deadline, cancelled, key)
+            try:
+                try:
+                    started = time.monotonic()
+                    response = method(**call_kwargs)
+                    elapsed = time.monotonic() - started
+                finally:
+                    self.slots.release()
+            except errors.APIError as e:
+                if e.code not in RETRYABLE_CODES or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+                attempt += 1
+                print(f"[Gemini] {e.code} 응답, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                if cancelled.wait(delay):
+                    raise DeadlineExceeded(f"{key}: 재시도 전에 취소됨")
+                continue
+
+            self.latency.record(key, elapsed)
+            used = _used_tokens(response)
+            if used is not None:
+                self.tokens.adjust(used - estimate)
+            return response
+
+    def stream(self, kwargs, deadline: Optional[Deadline] = None) -> Iterator:
+        """
+        스트리밍 요청 (반복을 시작할 때 한도를 확인)
+
+        첫 청크를 받기 전에 실패하면 재시도하고, 이후의 실패는 그대로 전달합니다.
+        (이미 받은 텍스트를 버리고 다시 시작하면 헤더 콜백이 중복 호출되므로 헤징도 하지 않음)
+        deadline이 지나면 청크 사이에서 DeadlineExceeded를 발생시킵니다.
+        """
+        attempt = 0
+        while True:
+            call_kwargs, estimate = self._reserve(kwargs, deadline, None, "stream")
+            try:
+                try:
+                    iterator = iter(self.client.models.generate_content_stream(**call_kwargs))
+                    last = next(iterator, None)
+                except errors.APIError as e:
+                    if e.code not in RETRYABLE_CODES or attempt >= self.max_retries:
+                        raise
+                    code, delay = e.code, self._backoff(attempt, e)
+                    if deadline is not None and delay >= deadline.remaining():
+                        raise
+                else:
+                    try:
+                        if last is not None:
+                            yield last
+                            for chunk in iterator:
+                                if deadline is not None:
+                                    deadline.check("stream")
+                                last = chunk
+                                yield chunk
+                    finally:
+                        # 사용량은 마지막 청크에 누적되어 옴
+                        used = _used_tokens(last)
+                        if used is not None:
+                            self.tokens.adjust(used - estimate)
+                    return
+            finally:
+                self.slots.release()
+            attempt += 1
+            print(f"[Gemini] {code} 응답, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+            time.sleep(delay)
+
+
+def get_gemini_client(api_key: Optional[str] = None) -> Optional[GeminiClientPool]:
+    """
+    프로세스 전체에서 공유하는 Gemini 클라이언트 (API 키가 없으면 None)
+    """
+    global _instance
+    api_key = api_key or os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None
+    with _instance_lock:
+        if _instance is None:
+            _instance = GeminiClientPool(api_key)
+        return _instance
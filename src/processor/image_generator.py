@@ -2,29 +2,59 @@ import os
 import base64
 import requests
 import random
+import time
 from typing import Optional
-from google import genai
 from google.genai import types
+from .gemini_pool import get_gemini_client
+from .deadline import Deadline
+from .image_pipeline import optimize_image, MultipartBody
+from .image_pool import TopicImagePool
+from ..storage import ImageStore
 
 class ImageGenerator:
     """
     Gemini 2.0 Flash 이미지 생성 + ImgBB 업로드
+    같은 프롬프트(정규화 기준)로 이미 올린 이미지가 있으면 다시 생성하지 않고 재사용합니다.
     """
     
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
         self.imgbb_key = os.getenv("IMGBB_API_KEY")
-        self.client = None
-        if self.api_key:
-            self.client = genai.Client(api_key=self.api_key)
+        self.client = get_gemini_client(self.api_key)
+        # ImgBB 자동 삭제까지 걸리는 시간(초), 0이면 만료 없음
+        self.expiration = int(os.getenv("IMGBB_EXPIRATION", "2592000"))
+        # 만료까지 이 기간보다 적게 남은 이미지는 재사용하지 않음 (refresh 스크립트가 다시 올리는 구간)
+        self.refresh_window = float(os.getenv("IMAGE_REFRESH_DAYS", "3")) * 86400
+        self.image_store = ImageStore()
+        # 주제별 미리 만든 이미지 (IMAGE_POOL=false면 사용하지 않음)
+        self.image_pool = None
+        if os.getenv("IMAGE_POOL", "true").lower() in ("1", "true", "yes"):
+            self.image_pool = TopicImagePool(self.image_store)
     
-    def generate_and_upload(self, prompt: str) -> Optional[str]:
+    def generate_and_upload(self, prompt: str, deadline: Optional[Deadline] = None,
+                            use_pool: bool = True, store_key: Optional[str] = None) -> Optional[str]:
         """
         Gemini로 이미지 생성 후 ImgBB에 업로드하여 URL 반환
+        저장된 같은 프롬프트 이미지 → 주제 풀 이미지 순으로 먼저 찾고, 없을 때만 생성합니다.
+        deadline이 지나면 기다리지 않고 fallback 이미지를 사용합니다.
+        store_key: 저장소에 기록할 키 (기본: prompt, 풀 채우기에서 슬롯 이름으로 사용)
         """
+        store_key = store_key or prompt
+        cached_url = self.image_store.get(store_key, min_ttl=self.refresh_window)
+        if cached_url:
+            print(f"[이미지 캐시] 저장된 이미지 사용: {cached_url}")
+            return cached_url
+        if use_pool and self.image_pool:
+            pool_url = self.image_pool.match(prompt, min_ttl=self.refresh_window)
+            if pool_url:
+                print(f"[이미지 풀] 주제 이미지 사용: {pool_url}")
+                return pool_url
         if not self.client:
             print("[DEBUG] Gemini client가 없음 - fallback")
-            return self._get_fallback_url()
+            return self.fallback_url()
+        if deadline is not None and deadline.expired:
+            print("[DEBUG] 이미지 시간 예산 없음 - fallback")
+            return self.fallback_url()
         
         try:
             print(f"[DEBUG] 이미지 생성 시도: {prompt[:50]}...")
@@ -35,7 +65,9 @@ class ImageGenerator:
                 contents=f"Generate a clean, professional illustration for a tech blog about: {prompt}. IMPORTANT: Do NOT include any text, words, letters, or typography in the image. Pure visual illustration only.",
                 config=types.GenerateContentConfig(
                     response_modalities=["IMAGE", "TEXT"],
-                )
+                ),
+                deadline=deadline,
+                latency_key="image",
             )
             
             print(f"[DEBUG] Response 받음: {type(response)}")
@@ -52,19 +84,24 @@ class ImageGenerator:
                                 
                                 image_data = part.inline_data.data
                                 
-                                # bytes인 경우 base64로 인코딩
-                                if isinstance(image_data, bytes):
-                                    image_base64 = base64.b64encode(image_data).decode('utf-8')
-                                else:
-                                    image_base64 = str(image_data)
+                                # base64 문자열로 온 경우 원본 bytes로 복원 (저장소에 파일로 보관)
+                                if not isinstance(image_data, bytes):
+                                    image_data = base64.b64decode(image_data)
                                 
-                                print(f"[DEBUG] Base64 길이: {len(image_base64)}")
+                                # 표시 너비로 줄이고 WebP/JPEG로 변환
+                                original_size = len(image_data)
+                                image_data, mime_type = optimize_image(
+                                    image_data, part.inline_data.mime_type or "image/png"
+                                )
+                                print(f"[DEBUG] 이미지 변환: {original_size} → {len(image_data)} bytes ({mime_type})")
                                 
                                 # ImgBB에 업로드
                                 if self.imgbb_key:
-                                    upload_url = self._upload_to_imgbb(image_base64)
+                                    upload_url = self.upload_image(image_data, deadline, mime_type)
                                     if upload_url:
                                         print(f"[DEBUG] ImgBB 업로드 성공: {upload_url}")
+                                        self.image_store.put(store_key, upload_url, image_data, mime_type,
+                                                             self.expires_at())
                                         return upload_url
                                     else:
                                         print("[DEBUG] ImgBB 업로드 실패")
@@ -75,22 +112,34 @@ class ImageGenerator:
                                 print(f"[DEBUG] Text part: {part.text[:100] if part.text else 'empty'}...")
             
             print("[DEBUG] 이미지 파트를 찾지 못함 - fallback")
-            return self._get_fallback_url()
+            return self.fallback_url()
             
         except Exception as e:
             print(f"[DEBUG] 이미지 생성 오류: {type(e).__name__}: {e}")
-            return self._get_fallback_url()
+            return self.fallback_url()
+    
+    def expires_at(self) -> Optional[float]:
+        """지금 올리는 이미지의 만료 시각 (만료 없으면 None)"""
+        return time.time() + self.expiration if self.expiration > 0 else None
     
-    def _upload_to_imgbb(self, image_base64: str) -> Optional[str]:
-        """ImgBB에 base64 이미지 업로드 (30일 후 자동 삭제)"""
+    def upload_image(self, image_data: bytes, deadline: Optional[Deadline] = None,
+                     mime_type: str = "application/octet-stream") -> Optional[str]:
+        """
+        이미지 bytes를 ImgBB에 올리고 URL 반환 (IMGBB_EXPIRATION초 후 자동 삭제)
+        base64로 바꾸지 않고 multipart 본문으로 바로 스트리밍합니다.
+        """
         try:
+            timeout = 30.0
+            if deadline is not None:
+                deadline.check("imgbb")
+                timeout = min(timeout, deadline.remaining())
             url = "https://api.imgbb.com/1/upload"
-            payload = {
-                "key": self.imgbb_key,
-                "image": image_base64,
-                "expiration": 2592000,
-            }
-            response = requests.post(url, data=payload)
+            fields = {"key": self.imgbb_key}
+            if self.expiration > 0:
+                fields["expiration"] = str(self.expiration)
+            body = MultipartBody(fields, "image", image_data, mime_type=mime_type)
+            response = requests.post(url, data=body, headers={"Content-Type": body.content_type},
+                                     timeout=timeout)
             
             print(f"[DEBUG] ImgBB 응답 코드: {response.status_code}")
             
@@ -104,12 +153,16 @@ class ImageGenerator:
             print(f"[DEBUG] ImgBB 오류: {e}")
             return None
     
-    def _get_fallback_url(self) -> str:
+    def fallback_url(self) -> str:
         """Fallback: Lorem Picsum 무료 이미지"""
         seed = random.randint(1, 1000)
         return f"https://picsum.photos/seed/{seed}/800/450"
     
-    def generate_image_html(self, prompt: str, alt_text: str = "AI 생성 이미지") -> str:
-        """이미지 HTML 태그 생성"""
-        image_url = self.generate_and_upload(prompt)
+    @staticmethod
+    def image_html(image_url: str, alt_text: str = "AI 생성 이미지") -> str:
+        """이미 생성된 이미지 URL로 HTML 태그 생성"""
         return f'<p><img src="{image_url}" alt="{alt_text}" style="width:100%; max-width:800px; border-radius:8px;"></p>'
+
+    def generate_image_html(self, prompt: str, alt_text: str = "AI 생성 이미지") -> str:
+        """이미지 HTML 태그 생성 (주제 풀에 맞는 이미지가 있으면 생성 없이 바로 사용)"""
+        return self.image_html(self.generate_and_upload(prompt), alt_text)
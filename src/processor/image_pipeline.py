@@ -0,0 +1,99 @@
+"""
+생성 이미지 후처리/업로드 본문
+=============================
+- optimize_image: 표시 너비(IMAGE_MAX_WIDTH, 기본 800px)로 줄이고 WebP/JPEG로 다시 인코딩
+  (Pillow가 없으면 원본 그대로 사용)
+- MultipartBody: 이미지 bytes를 base64 문자열로 바꾸지 않고 multipart/form-data로 바로 보내는 본문
+  requests가 __len__으로 Content-Length를 정하고 read()로 나눠 읽으므로 이미지를 다시 복사하지 않습니다.
+"""
+
+import io
+import os
+import uuid
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+MIME_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+
+
+def optimize_image(data: bytes, mime_type: str = "image/png") -> Tuple[bytes, str]:
+    """
+    표시용 크기/형식으로 변환한 (bytes, mime_type) 반환
+    변환 결과가 원본보다 크거나 변환할 수 없으면 원본을 그대로 돌려줍니다.
+    """
+    if not PIL_AVAILABLE:
+        return data, mime_type
+
+    max_width = int(os.getenv("IMAGE_MAX_WIDTH", "800"))
+    fmt = os.getenv("IMAGE_FORMAT", "webp").upper()
+    fmt = "JPEG" if fmt in ("JPG", "JPEG") else "WEBP"
+    quality = int(os.getenv("IMAGE_QUALITY", "80"))
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width > max_width:
+                height = round(image.height * max_width / image.width)
+                image = image.resize((max_width, height), Image.LANCZOS)
+            if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            out = io.BytesIO()
+            image.save(out, fmt, quality=quality, optimize=True)
+    except Exception as e:
+        print(f"[이미지] 변환 실패, 원본 사용: {e}")
+        return data, mime_type
+
+    if out.tell() >= len(data):
+        return data, mime_type
+    return out.getvalue(), MIME_TYPES[fmt]
+
+
+class MultipartBody:
+    """
+    스트리밍 multipart/form-data 본문 (텍스트 필드 + 파일 하나)
+
+    파일 부분은 memoryview 조각으로 읽어 나가므로 본문 전체를 메모리에 다시 만들지 않습니다.
+    """
+
+    def __init__(self, fields: Dict[str, str], file_field: str, data: bytes,
+                 filename: str = "image", mime_type: str = "application/octet-stream"):
+        self.boundary = uuid.uuid4().hex
+        head = b"".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._parts: List[memoryview] = [memoryview(head), memoryview(data), memoryview(tail)]
+        self._length = sum(len(part) for part in self._parts)
+        self._index = 0
+        self._offset = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        chunks = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            chunk = part[self._offset:self._offset + size]
+            chunks.append(chunk.tobytes())
+            size -= len(chunk)
+            self._offset += len(chunk)
+            if self._offset >= len(part):
+                self._index += 1
+                self._offset = 0
+        return b"".join(chunks)
@@ -0,0 +1,125 @@
+"""
+주제별 미리 만든 이미지 풀
+=============================
+자주 나오는 주제(LLM, 로봇, 반도체, Apple, Google 등)마다 이미지를 몇 장씩 미리 생성/업로드해 두고,
+발행 시에는 제목 키워드로 주제를 찾아 바로 재사용합니다. 맞는 주제가 없을 때만 새로 생성합니다.
+키워드 하나만 스친 제목까지 풀 이미지를 쓰면 거의 모든 글이 같은 몇 장을 돌려 쓰게 되므로,
+주제 점수가 IMAGE_POOL_MIN_SCORE 이상일 때만 풀을 사용합니다.
+
+풀 이미지는 ImageStore에 "pool:<주제>:<번호>" 프롬프트로 저장되므로 만료 관리와
+refresh_images.py의 재업로드 대상에 그대로 포함됩니다. 채우기는 scripts/fill_image_pool.py.
+"""
+
+import hashlib
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+from ..storage import ImageStore
+
+_TOKEN_RE = re.compile(r"[a-z0-9가-힣]+")
+
+# 여러 주제의 기사에 흔히 나오는 키워드 (0.5점)
+GENERIC_KEYWORDS = {
+    "gpt", "gemini", "meta", "mac", "cloud", "server", "servers", "law", "policy", "safety",
+    "health", "drug", "security", "privacy", "hack", "windows", "diffusion", "funding", "raises",
+    "investment", "startup", "startups", "chip", "chips", "안전", "투자", "보안",
+}
+
+# 주제: (키워드, 이미지 생성 프롬프트)
+TOPICS: Dict[str, Tuple[List[str], str]] = {
+    "llm": (["llm", "llms", "chatgpt", "gpt", "claude", "gemini", "chatbot", "language model", "언어모델", "챗봇"],
+            "large language models and AI chatbots, glowing neural text streams"),
+    "openai": (["openai", "sam altman", "sora", "오픈ai"],
+               "an abstract futuristic AI research lab with soft light"),
+    "robotics": (["robot", "robots", "robotics", "humanoid", "로봇", "휴머노이드"],
+                 "modern humanoid and industrial robots in a clean lab"),
+    "chips": (["chip", "chips", "gpu", "gpus", "semiconductor", "nvidia", "tsmc", "amd", "반도체", "엔비디아"],
+              "close-up of a glowing AI semiconductor chip on a circuit board"),
+    "apple": (["apple", "iphone", "ipad", "mac", "siri", "애플", "아이폰"],
+              "minimalist sleek consumer devices on a bright desk"),
+    "google": (["google", "deepmind", "android", "alphabet", "구글"],
+               "colorful abstract search and data network visualization"),
+    "microsoft": (["microsoft", "copilot", "azure", "windows", "마이크로소프트"],
+                  "cloud computing and productivity software abstract scene"),
+    "meta": (["meta", "llama", "facebook", "instagram", "zuckerberg", "메타"],
+             "social network nodes connected in a virtual space"),
+    "autonomous": (["self driving", "autonomous", "waymo", "tesla", "robotaxi", "자율주행"],
+                   "autonomous electric car driving through a smart city at dusk"),
+    "image_generation": (["midjourney", "stable diffusion", "diffusion", "image generation", "video generation", "dall"],
+                         "an AI painting a vivid digital artwork on a floating canvas"),
+    "datacenter": (["data center", "datacenter", "cloud", "server", "servers", "데이터센터"],
+                   "rows of illuminated servers in a large data center"),
+    "policy": (["regulation", "policy", "law", "lawsuit", "safety", "ethics", "규제", "법안", "안전"],
+               "balanced scales and a shield over an abstract AI network"),
+    "funding": (["funding", "startup", "startups", "raises", "valuation", "investment", "투자", "스타트업"],
+                "startup team growth chart with abstract AI shapes"),
+    "healthcare": (["health", "medical", "drug", "hospital", "protein", "의료", "신약"],
+                   "AI assisting medical research with DNA and molecule visuals"),
+    "security": (["security", "cyber", "hack", "hacker", "malware", "privacy", "보안", "해킹"],
+                 "a digital lock protecting a glowing data network"),
+}
+
+
+def _tokens(text: str) -> set:
+    words = _TOKEN_RE.findall((text or "").lower())
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+class TopicImagePool:
+    """
+    주제별 이미지 풀 조회/채우기 대상 계산
+
+    match(text)는 키워드 점수(키워드당 1점, 흔한 키워드는 0.5점)가 가장 높은 주제를 고르되
+    min_score에 못 미치면 풀을 쓰지 않습니다. (기본 2점: 구체적인 키워드 두 개 이상)
+    같은 주제 안에서는 제목 해시로 슬롯을 정해 글마다 이미지가 조금씩 달라지도록 합니다.
+    """
+
+    def __init__(self, store: ImageStore, size: Optional[int] = None,
+                 topics: Optional[Dict[str, Tuple[List[str], str]]] = None,
+                 min_score: Optional[float] = None):
+        self.store = store
+        self.size = size or int(os.getenv("IMAGE_POOL_SIZE", "3"))
+        self.topics = topics or TOPICS
+        self.min_score = min_score if min_score is not None else float(os.getenv("IMAGE_POOL_MIN_SCORE", "2"))
+
+    @staticmethod
+    def slot_prompt(topic: str, slot: int) -> str:
+        return f"pool:{topic}:{slot}"
+
+    def topic_for(self, text: str) -> Optional[str]:
+        tokens = _tokens(text)
+        best, best_score = None, 0.0
+        for topic, (keywords, _) in self.topics.items():
+            score = sum(0.5 if keyword in GENERIC_KEYWORDS else 1.0 for keyword in keywords if keyword in tokens)
+            if score > best_score:
+                best, best_score = topic, score
+        return best if best_score >= self.min_score else None
+
+    def match(self, text: str, min_ttl: float = 0.0) -> Optional[str]:
+        """제목에 맞는 풀 이미지 URL (맞는 주제나 유효한 이미지가 없으면 None)"""
+        topic = self.topic_for(text)
+        if topic is None:
+            return None
+        start = int(hashlib.sha1((text or "").encode("utf-8")).hexdigest(), 16) % self.size
+        for i in range(self.size):
+            url = self.store.get(self.slot_prompt(topic, (start + i) % self.size), min_ttl=min_ttl)
+            if url:
+                return url
+        return None
+
+    def missing(self, min_ttl: float = 0.0) -> List[Tuple[str, int, str]]:
+        """
+        채워야 할 (주제, 슬롯, 생성 프롬프트) 목록 (없거나 곧 만료되는 슬롯)
+        곧 만료되더라도 이미 글에 쓰인 슬롯은 refresh_images.py가 같은 이미지를 다시 올리므로 제외합니다.
+        """
+        missing = []
+        for topic, (_, prompt) in self.topics.items():
+            for slot in range(self.size):
+                key = self.slot_prompt(topic, slot)
+                if self.store.get(key, min_ttl=min_ttl):
+                    continue
+                current = self.store.lookup(key)
+                if current and self.store.posts_using(current["url"]):
+                    continue
+                missing.append((topic, slot, f"{prompt} (variation {slot + 1})"))
+        return missing
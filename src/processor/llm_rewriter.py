@@ -1,7 +1,16 @@
 import os
-from google import genai
-from typing import Dict, Any, List
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple
 from .image_generator import ImageGenerator
+from .batch_backend import GeminiBatchBackend, LocalBackend, Generation, token_usage
+from .stream_parser import StreamingHeaderParser
+from .gemini_pool import get_gemini_client
+from .deadline import Deadline
+from .compressor import PromptCompressor
+from .validation import validate_article, article_schema
+from ..storage import PersistentCache, PostIndex, data_path
 
 # 쿠팡 파트너스 연동 (선택사항)
 try:
@@ -10,12 +19,136 @@ try:
 except ImportError:
     COUPANG_AVAILABLE = False
 
+MODEL_NAME = "gemini-2.0-flash-exp"
+
+# 재작성 규칙 (모든 기사에 공통, system instruction으로 한 번만 설정)
+REWRITE_RULES = """
+당신은 SEO 전문가이자 바이럴 콘텐츠 작성자입니다.
+사용자가 보내는 영어 기술 뉴스를 한국어 블로그 포스팅으로 재작성해주세요.
+
+[SEO 최적화 핵심 전략]
+
+1. **제목 작성 (SEO + 클릭 유도 둘 다 필요!)**:
+   [필수] 제목에 반드시 핵심 검색 키워드를 포함!
+   
+   [키워드 우선 제목 패턴]:
+   - "[회사명] [제품명] [동작]" + 매력적 후킹
+   - 예: "ChatGPT 이미지 생성 기능 출시, 포토샵 대체할까?"
+   - 예: "구글 제미나이 2.0 발표, GPT-4 넘어섰나?"
+   - 예: "테슬라 로보택시 공개, 2025년 상용화 가능성은?"
+   - 예: "애플 AI 시리 업그레이드, 경쟁사 따라잡을 수 있을까?"
+   
+   [제목 작성 규칙]:
+   - 핵심 키워드(회사명, 제품명, 기술명)를 제목 맨 앞에 배치
+   - 30자 내외로 간결하게
+   - 뒤에 호기심 유발 문구 추가 (?, ... 활용)
+   - "충격!", "속보!" 같은 자극적인 표현 금지
+   
+2. **메타 설명 (Meta Description) - 매우 중요!**:
+   - 150자 내외의 글 요약
+   - 핵심 키워드 자연스럽게 포함
+   - 클릭 유도하는 문장으로 작성
+   - 예: "구글이 발표한 제미나이 2.0의 새로운 기능과 GPT-4와의 비교 분석. AI 업계 판도가 바뀔 수 있는 이유를 알아봅니다."
+
+3. **이미지 설명 (Alt Text)**:
+   - 단순히 "이미지"가 아닌 구체적인 설명
+   - 예: "ChatGPT 이미지 생성 기능 실제 사용 화면"
+   - 예: "구글 제미나이 2.0 발표 현장 사진"
+   - 핵심 키워드 포함
+
+4. **본문 SEO 구조**:
+   - 첫 문단에 핵심 키워드 자연스럽게 포함
+   - <h2> 태그로 소제목 구성 (3-4개)
+   - 소제목에도 키워드 포함
+   - 본문 1500자 이상 작성
+   - 마지막에 요약/결론 섹션 추가
+
+5. **HTML 형식 규칙**:
+   - 반드시 HTML 태그만 사용!
+   - 마크다운 문법(**, ##, *, - 등) 절대 금지!
+   - 소제목: <h2> (절대 h3 이하 사용 금지, 첫 소제목은 h2 필수!)
+   - 문단: <p>
+   - 강조: <strong>
+   - 인용: <blockquote>
+   - 리스트: <ul>, <li>
+   - 링크: <a href="...">
+   - 글 마지막: "출처: <a href='원문 링크'>원문 보기</a>" (원문 링크는 [원문 정보]의 링크)
+
+6. **언어 규칙**:
+   - 반드시 한국어로만 작성
+   - 영어는 고유명사(회사명, 제품명, 인명)에만 허용
+
+7. **태그/라벨 생성**:
+   - 글 내용에 맞는 관련 태그 5개 생성
+   - 필수: "AI" 또는 관련 기술명
+   - 회사명, 제품명, 기술 용어 포함
+"""
+
+# lines 형식 출력 규칙
+SYSTEM_INSTRUCTION = REWRITE_RULES + """
+[출력 형식 - 정확히 지킬 것!]
+첫 줄: "TITLE: 제목"
+둘째 줄: "META: 메타 설명 (150자 내외)"
+셋째 줄: "ALT: 이미지 대체 텍스트"
+넷째 줄: "TAGS: 태그1, 태그2, 태그3, 태그4, 태그5"
+다섯째 줄부터: 본문 (HTML)
+"""
+
+# json 형식 출력 규칙 (필드 구조는 response_schema로 지정)
+JSON_SYSTEM_INSTRUCTION = REWRITE_RULES + """
+[출력]
+지정된 JSON 스키마로만 출력하세요.
+title=제목, meta_description=메타 설명, alt_text=이미지 대체 텍스트, tags=태그 5개, content=HTML 본문
+"""
+
+
 class ContentProcessor:
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
-        self.client = None
-        if self.api_key:
-            self.client = genai.Client(api_key=self.api_key)
+        # ImageGenerator와 같은 클라이언트/한도 공유 (API 키가 없으면 None)
+        self.client = get_gemini_client(self.api_key)
+        
+        # 스트리밍 재작성 (헤더를 받는 즉시 파싱, ALT가 오면 이미지 생성 시작)
+        self.stream = os.getenv("REWRITE_STREAM", "false").lower() in ("1", "true", "yes")
+        
+        # 출력 형식: lines(TITLE:/META: 줄 형식) 또는 json(스키마 기반 구조화 출력 + 검증/부분 재요청)
+        self.output_format = os.getenv("REWRITE_FORMAT", "lines").lower()
+        self.max_repair_attempts = int(os.getenv("REWRITE_MAX_REPAIRS", "1"))
+        
+        # 고정 재작성 규칙 전달 방식 (컨텍스트 캐시 또는 system instruction)
+        self.generation_config = self._create_generation_config() if self.client else None
+        if self.generation_config and self.output_format == "json":
+            self.generation_config = {
+                **self.generation_config,
+                "response_mime_type": "application/json",
+                "response_schema": article_schema(),
+            }
+        
+        # 기사별 시간 예산(초)과 단계별 몫 (이미지는 재작성과 동시에 진행)
+        self.article_budget = float(os.getenv("ARTICLE_BUDGET", "180"))
+        self.rewrite_budget_share = float(os.getenv("REWRITE_BUDGET_SHARE", "0.8"))
+        self.image_budget_share = float(os.getenv("IMAGE_BUDGET_SHARE", "0.5"))
+        
+        # 배치 재작성 백엔드 (REWRITE_BACKEND=local이면 오프라인 대체 백엔드)
+        self.model_name = MODEL_NAME
+        self.batch_backend = None
+        # 대체 백엔드의 결과는 자리표시 본문이므로 발행하면 안 됨 (main.py가 확인)
+        self.local_backend = os.getenv("REWRITE_BACKEND", "").lower() == "local"
+        if self.local_backend:
+            self.model_name = "local"  # 대체 백엔드 결과가 실제 캐시와 섞이지 않도록
+            self.batch_backend = LocalBackend()
+        elif self.client:
+            # 개별 요청으로 전환됐을 때는 기사 하나의 재작성 몫만큼만 기다림
+            self.batch_backend = GeminiBatchBackend(self.client, MODEL_NAME, config=self.generation_config,
+                                                    request_timeout=self.article_budget * self.rewrite_budget_share)
+        
+        # 재작성 응답 캐시 (발행 실패 후 재실행 시 같은 기사를 다시 생성하지 않도록)
+        self.response_cache = PersistentCache(
+            data_path("llm_cache.sqlite3"),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500")),
+            ttl=float(os.getenv("LLM_CACHE_TTL_DAYS", "7")) * 86400,
+        )
+        self.response_cache.prune()
         
         self.image_generator = ImageGenerator()
         
@@ -25,24 +158,58 @@ class ContentProcessor:
             self.coupang_recommender = CoupangProductRecommender()
             print("[쿠팡 파트너스] 연동 활성화")
         
-        # 최근 발행된 글 목록 (내부 링크용)
-        self.recent_posts = []
+        # 기사별 이미지 생성 / 상품 추천을 텍스트 재작성과 동시에 실행
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("ARTICLE_CONCURRENCY", "4")),
+            thread_name_prefix="article",
+        )
+        
+        # 원문 내용 정리/축약 (PROMPT_TOKEN_BUDGET 토큰 이내)
+        self.compressor = PromptCompressor()
+        
+        # 발행한 글 색인 (실행이 끝나도 유지, 관련 글 내부 링크용)
+        self.post_index = PostIndex()
+        self.related_links = int(os.getenv("RELATED_LINKS", "3"))
 
-    def add_recent_post(self, title: str, url: str):
-        """최근 발행된 글 추가 (내부 링크용)"""
-        self.recent_posts.append({"title": title, "url": url})
-        # 최대 10개만 유지
-        if len(self.recent_posts) > 10:
-            self.recent_posts.pop(0)
+    def _create_generation_config(self) -> Dict[str, Any]:
+        """
+        GEMINI_CONTEXT_CACHE가 켜져 있으면 고정 규칙을 Gemini 컨텍스트 캐시에 올려 재사용하고,
+        그렇지 않거나 캐시 생성에 실패하면 system instruction으로 매 요청에 붙입니다.
+        """
+        instruction = self.system_instruction
+        if os.getenv("GEMINI_CONTEXT_CACHE", "false").lower() in ("1", "true", "yes"):
+            try:
+                cache = self.client.caches.create(
+                    model=MODEL_NAME,
+                    config={
+                        "system_instruction": instruction,
+                        "display_name": f"ai-feed-rewrite-{self.output_format}-"
+                                        f"{hashlib.sha256(instruction.encode('utf-8')).hexdigest()[:8]}",
+                        "ttl": os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600s"),
+                    },
+                )
+                print(f"[Gemini] 컨텍스트 캐시 생성: {cache.name}")
+                return {"cached_content": cache.name}
+            except Exception as e:
+                print(f"[Gemini] 컨텍스트 캐시 생성 실패, system instruction 사용: {e}")
+        return {"system_instruction": instruction}
+
+    @property
+    def system_instruction(self) -> str:
+        """출력 형식에 맞는 고정 규칙"""
+        return JSON_SYSTEM_INSTRUCTION if self.output_format == "json" else SYSTEM_INSTRUCTION
+
+    def add_recent_post(self, title: str, url: str, tags: Optional[List[str]] = None, content: str = ""):
+        """발행된 글을 색인에 추가 (내부 링크용, content는 관련 글/상품 블록을 뺀 재작성 본문)"""
+        self.post_index.add(title, url, tags=tags, content=content)
 
-    def _generate_internal_links_html(self) -> str:
-        """관련 글 내부 링크 HTML 생성"""
-        if not self.recent_posts:
+    def _generate_internal_links_html(self, title: str = "", content: str = "",
+                                      tags: Optional[List[str]] = None) -> str:
+        """관련 글 내부 링크 HTML 생성 (키워드/태그 관련도 순, 부족하면 최근 글)"""
+        recent = self.post_index.related(title, content, tags, limit=self.related_links)
+        if not recent:
             return ""
         
-        # 최근 3개 글만 표시
-        recent = self.recent_posts[-3:]
-        
         links_html = """
 <div style="background:#f8f9fa; padding:20px; border-radius:10px; margin:30px 0;">
 <h3 style="margin-top:0;">📚 관련 글 더 보기</h3>
@@ -54,177 +221,358 @@ class ContentProcessor:
         links_html += "</ul></div>"
         return links_html
 
-    def process_content(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.client:
-            return {
-                "title": f"[Demo] {raw_data['title']}",
-                "content": f"Source: {raw_data['url']}\n\n{raw_data['original_content']}",
-                "tags": ["AI"],
-                "meta_description": "",
-                "original_url": raw_data['url']
-            }
+    def _cache_key(self, prompt: str) -> str:
+        """
+        모델 이름 + 출력 형식 + 고정 규칙 + 실제로 보내는 프롬프트(축약 후)로 만든 캐시 키
+        규칙이나 축약 방식이 바뀌면 키도 바뀌므로 이전 재작성을 다시 쓰지 않습니다.
+        """
+        payload = "\n".join((self.model_name, self.output_format, self.system_instruction, prompt))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-        prompt = f"""
-        당신은 SEO 전문가이자 바이럴 콘텐츠 작성자입니다.
-        다음 영어 기술 뉴스를 한국어 블로그 포스팅으로 재작성해주세요.
-        
+    def _cache_output(self, cache_key: str, parser: StreamingHeaderParser):
+        """제목 헤더와 본문이 모두 있는 응답만 캐시 (거절/깨진 응답을 TTL 내내 다시 쓰지 않도록)"""
+        if "TITLE" in parser.headers and parser.body:
+            self.response_cache.set(cache_key, parser.text)
+
+    def _demo_result(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "title": f"[Demo] {raw_data['title']}",
+            "content": f"Source: {raw_data['url']}\n\n{raw_data['original_content']}",
+            "tags": ["AI"],
+            "meta_description": "",
+            "original_url": raw_data['url']
+        }
+
+    def _error_result(self, raw_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        print(f"Gemini API 오류: {error}")
+        return {
+            "title": raw_data['title'],
+            "content": f"Error: {error}",
+            "tags": ["Error"],
+            "meta_description": "",
+            "original_url": raw_data['url'],
+            "error": str(error)
+        }
+
+    def _build_prompt(self, raw_data: Dict[str, Any]) -> str:
+        """기사별로 바뀌는 부분만 담은 요청 (고정 규칙은 SYSTEM_INSTRUCTION)"""
+        return f"""
         [원문 정보]
         제목: {raw_data['title']}
-        내용: {raw_data['original_content']}
+        내용: {self.compressor.compress(raw_data['original_content'])}
         출처: {raw_data['source']}
         링크: {raw_data['url']}
-        
-        [SEO 최적화 핵심 전략]
-        
-        1. **제목 작성 (SEO + 클릭 유도 둘 다 필요!)**:
-           [필수] 제목에 반드시 핵심 검색 키워드를 포함!
-           
-           [키워드 우선 제목 패턴]:
-           - "[회사명] [제품명] [동작]" + 매력적 후킹
-           - 예: "ChatGPT 이미지 생성 기능 출시, 포토샵 대체할까?"
-           - 예: "구글 제미나이 2.0 발표, GPT-4 넘어섰나?"
-           - 예: "테슬라 로보택시 공개, 2025년 상용화 가능성은?"
-           - 예: "애플 AI 시리 업그레이드, 경쟁사 따라잡을 수 있을까?"
-           
-           [제목 작성 규칙]:
-           - 핵심 키워드(회사명, 제품명, 기술명)를 제목 맨 앞에 배치
-           - 30자 내외로 간결하게
-           - 뒤에 호기심 유발 문구 추가 (?, ... 활용)
-           - "충격!", "속보!" 같은 자극적인 표현 금지
-           
-        2. **메타 설명 (Meta Description) - 매우 중요!**:
-           - 150자 내외의 글 요약
-           - 핵심 키워드 자연스럽게 포함
-           - 클릭 유도하는 문장으로 작성
-           - 예: "구글이 발표한 제미나이 2.0의 새로운 기능과 GPT-4와의 비교 분석. AI 업계 판도가 바뀔 수 있는 이유를 알아봅니다."
-        
-        3. **이미지 설명 (Alt Text)**:
-           - 단순히 "이미지"가 아닌 구체적인 설명
-           - 예: "ChatGPT 이미지 생성 기능 실제 사용 화면"
-           - 예: "구글 제미나이 2.0 발표 현장 사진"
-           - 핵심 키워드 포함
-        
-        4. **본문 SEO 구조**:
-           - 첫 문단에 핵심 키워드 자연스럽게 포함
-           - <h2> 태그로 소제목 구성 (3-4개)
-           - 소제목에도 키워드 포함
-           - 본문 1500자 이상 작성
-           - 마지막에 요약/결론 섹션 추가
-        
-        5. **HTML 형식 규칙**:
-           - 반드시 HTML 태그만 사용!
-           - 마크다운 문법(**, ##, *, - 등) 절대 금지!
-           - 소제목: <h2> (절대 h3 이하 사용 금지, 첫 소제목은 h2 필수!)
-           - 문단: <p>
-           - 강조: <strong>
-           - 인용: <blockquote>
-           - 리스트: <ul>, <li>
-           - 링크: <a href="...">
-           - 글 마지막: "출처: <a href='{raw_data['url']}'>원문 보기</a>"
-        
-        6. **언어 규칙**:
-           - 반드시 한국어로만 작성
-           - 영어는 고유명사(회사명, 제품명, 인명)에만 허용
-        
-        7. **태그/라벨 생성**:
-           - 글 내용에 맞는 관련 태그 5개 생성
-           - 필수: "AI" 또는 관련 기술명
-           - 회사명, 제품명, 기술 용어 포함
-        
-        [출력 형식 - 정확히 지킬 것!]
-        첫 줄: "TITLE: 제목"
-        둘째 줄: "META: 메타 설명 (150자 내외)"
-        셋째 줄: "ALT: 이미지 대체 텍스트"
-        넷째 줄: "TAGS: 태그1, 태그2, 태그3, 태그4, 태그5"
-        다섯째 줄부터: 본문 (HTML)
         """
 
+    def _parse_output(self, text: str, raw_data: Dict[str, Any], cache_key: str,
+                      deadline: Optional[Deadline] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        출력 형식에 맞게 응답 파싱
+        json 형식이면 필드별로 검증하고 실패한 필드만 다시 요청합니다. (추가 토큰 사용량 반환)
+        """
+        if self.output_format != "json":
+            parser = StreamingHeaderParser()
+            parser.feed(text or "")
+            parser.close()
+            self._cache_output(cache_key, parser)
+            return self._parsed_from_stream(parser, raw_data), token_usage(None)
+
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash-exp",
-                contents=[prompt]
-            )
-            full_text = response.text
-            
-            # 파싱: 제목, 메타설명, ALT텍스트, 태그, 본문 분리
-            title = raw_data['title']
-            meta_description = ""
-            alt_text = "AI 관련 뉴스 이미지"
-            tags = ["AI", "테크뉴스", "인공지능"]
-            content = full_text
-            
-            lines = full_text.split('\n')
-            content_start_idx = 0
-            
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                if stripped.startswith("TITLE:"):
-                    title = stripped.replace("TITLE:", "").strip()
-                    content_start_idx = i + 1
-                elif stripped.startswith("META:"):
-                    meta_description = stripped.replace("META:", "").strip()
-                    content_start_idx = i + 1
-                elif stripped.startswith("ALT:"):
-                    alt_text = stripped.replace("ALT:", "").strip()
-                    content_start_idx = i + 1
-                elif stripped.startswith("TAGS:"):
-                    tags_str = stripped.replace("TAGS:", "").strip()
-                    tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
-                    content_start_idx = i + 1
-                elif stripped and not any(stripped.startswith(p) for p in ["TITLE:", "META:", "ALT:", "TAGS:"]):
-                    # 본문 시작
-                    content = "\n".join(lines[i:]).strip()
-                    break
-            
-            # 이미지 생성 (개선된 Alt 텍스트 사용)
-            print(f"이미지 생성 중... (Alt: {alt_text})")
-            main_image = self.image_generator.generate_image_html(
-                raw_data['title'], 
-                alt_text=alt_text
+            article = json.loads(text or "")
+            if not isinstance(article, dict):
+                article = {}
+        except ValueError:
+            article = {}
+
+        usage = token_usage(None)
+        errors = validate_article(article)
+        attempts = 0
+        while errors and attempts < self.max_repair_attempts and self.client:
+            if deadline is not None and deadline.expired:
+                print("[검증] 시간 예산이 없어 재요청 생략")
+                break
+            attempts += 1
+            print(f"[검증] 재요청 필드: {', '.join(errors)} ({'; '.join(errors.values())})")
+            try:
+                fixed, repair_usage = self._repair_fields(raw_data, article, errors, deadline)
+            except Exception as e:
+                # 재요청이 실패해도 기사 전체를 버리지 않고 수정 전 결과로 진행
+                print(f"[검증] 재요청 실패, 수정 전 결과 사용: {type(e).__name__}: {e}")
+                break
+            article.update(fixed)
+            for key in usage:
+                usage[key] += repair_usage[key]
+            errors = validate_article(article)
+        if errors:
+            print(f"[검증] 남은 문제: {errors}")
+        # 본문이 있는 결과만 캐시 (수정 요청으로 고친 필드 포함)
+        if isinstance(article.get("content"), str) and article["content"].strip():
+            self.response_cache.set(cache_key, json.dumps(article, ensure_ascii=False))
+
+        tags = article.get("tags") if isinstance(article.get("tags"), list) else []
+        return {
+            "title": article.get("title") or raw_data['title'],
+            "meta_description": article.get("meta_description") or "",
+            "alt_text": article.get("alt_text") or "AI 관련 뉴스 이미지",
+            "tags": [tag.strip() for tag in tags if isinstance(tag, str) and tag.strip()] or ["AI", "테크뉴스", "인공지능"],
+            "content": article.get("content") or "",
+        }, usage
+
+    def _repair_fields(self, raw_data: Dict[str, Any], article: Dict[str, Any], errors: Dict[str, str],
+                       deadline: Optional[Deadline] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """검증에 실패한 필드만 다시 생성"""
+        fields = list(errors)
+        problems = "\n".join(f"- {field}: {problem}" for field, problem in errors.items())
+        previous = json.dumps({field: article.get(field) for field in ("title", *fields)}, ensure_ascii=False)
+        prompt = self._build_prompt(raw_data) + f"""
+        [수정 요청]
+        이전에 작성한 글에서 아래 항목만 규칙에 맞게 다시 작성해주세요.
+        {problems}
+
+        [이전 결과]
+        {previous}
+        """
+        response = self.client.models.generate_content(
+            model=MODEL_NAME,
+            contents=[prompt],
+            config={**self.generation_config, "response_schema": article_schema(fields)},
+            deadline=deadline,
+            latency_key="repair",  # 짧은 필드 재생성이라 전체 재작성과 응답 시간 분포가 다름
+        )
+        if not response.text:
+            raise ValueError("empty repair response")
+        fixed = json.loads(response.text)
+        if not isinstance(fixed, dict):
+            raise ValueError("repair response is not a JSON object")
+        return {field: fixed[field] for field in fields if field in fixed}, token_usage(response)
+
+    def _parsed_from_stream(self, parser: StreamingHeaderParser, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """헤더 파서 결과를 재작성 결과 dict로 변환 (없는 항목은 기본값)"""
+        headers = parser.headers
+        tags = ["AI", "테크뉴스", "인공지능"]
+        if "TAGS" in headers:
+            tags = [tag.strip() for tag in headers["TAGS"].split(",") if tag.strip()]
+        return {
+            "title": headers.get("TITLE", raw_data['title']),
+            "meta_description": headers.get("META", ""),
+            "alt_text": headers.get("ALT", "AI 관련 뉴스 이미지"),
+            "tags": tags,
+            "content": parser.body or parser.text,
+        }
+
+    def _start_image(self, prompt: str, deadline: Optional[Deadline] = None,
+                     budget: Optional[float] = None) -> Future:
+        """
+        이미지 생성 시작 (기사 예산 중 IMAGE_BUDGET_SHARE만 사용, 넘기면 fallback 이미지)
+        deadline 대신 budget(초)을 주면 작업이 실제로 시작될 때부터 예산을 셉니다. (대기열에서 기다린 시간 제외)
+        """
+        def run():
+            if deadline is not None:
+                image_deadline = deadline.child(self.image_budget_share)
+            elif budget is not None:
+                image_deadline = Deadline(budget * self.image_budget_share)
+            else:
+                image_deadline = None
+            return self.image_generator.generate_and_upload(prompt, image_deadline)
+
+        return self._executor.submit(run)
+
+    def _start_side_tasks(self, raw_data: Dict[str, Any], start_image: bool = True,
+                          deadline: Optional[Deadline] = None, budget: Optional[float] = None) -> Dict[str, Future]:
+        """
+        텍스트 재작성과 겹쳐서 실행할 작업 시작
+        - 이미지: 원문 제목으로 바로 생성 (ALT 텍스트는 나중에 HTML에만 적용)
+          start_image=False면 스트리밍 중 ALT 줄이 도착했을 때 시작
+        - 상품 추천: 원문 제목/내용의 키워드로 검색
+        """
+        tasks = {}
+        if start_image:
+            print("이미지 생성 시작 (재작성과 동시 진행)")
+            tasks["image"] = self._start_image(raw_data['title'], deadline, budget)
+        if self.coupang_recommender:
+            tasks["products"] = self._executor.submit(
+                self.coupang_recommender.generate_product_html,
+                raw_data['title'], raw_data.get('original_content') or ""
             )
+        return tasks
+
+    def _build_result(self, raw_data: Dict[str, Any], parsed: Dict[str, Any],
+                      side_tasks: Optional[Dict[str, Future]] = None,
+                      deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        파싱된 재작성 결과에 이미지, 내부 링크, 상품 추천을 붙여 최종 결과 생성
+        deadline까지 끝나지 않은 부가 작업은 기다리지 않습니다. (이미지는 fallback)
+        """
+        title = parsed["title"]
+        alt_text = parsed["alt_text"]
+        content = parsed["content"]
+        if side_tasks is None:
+            side_tasks = self._start_side_tasks(raw_data)
+        if "image" not in side_tasks:
+            side_tasks["image"] = self._start_image(raw_data['title'], deadline)
+        wait_timeout = deadline.remaining() if deadline else None
+        
+        # 이미지 (개선된 Alt 텍스트 사용)
+        try:
+            image_url = side_tasks["image"].result(timeout=wait_timeout)
+        except FutureTimeoutError:
+            print("이미지 시간 예산 초과 - fallback 이미지 사용")
+            image_url = self.image_generator.fallback_url()
+        main_image = self.image_generator.image_html(image_url, alt_text=alt_text)
+        print(f"이미지 준비 완료 (Alt: {alt_text})")
+        
+        # 내부 링크 추가
+        internal_links = self._generate_internal_links_html(title, content, parsed["tags"])
+        
+        # 최종 콘텐츠 조합
+        final_content = main_image + "\n" + content
+        
+        # 내부 링크가 있으면 출처 앞에 삽입
+        if internal_links:
+            # 출처 링크 찾기
+            source_marker = f'출처: <a href="{raw_data["url"]}">'
+            if source_marker in final_content:
+                final_content = final_content.replace(
+                    source_marker, 
+                    internal_links + "\n<p>" + source_marker
+                )
+            else:
+                final_content += "\n" + internal_links
+        
+        # 쿠팡 파트너스 상품 추천 추가
+        if "products" in side_tasks:
+            try:
+                product_html = side_tasks["products"].result(timeout=deadline.remaining() if deadline else None)
+                if product_html:
+                    final_content += "\n" + product_html
+                    print("[쿠팡 파트너스] 상품 추천 추가됨")
+            except Exception as e:
+                print(f"[쿠팡 파트너스] 상품 추천 실패: {e}")
+        
+        return {
+            "title": title,
+            "content": final_content,
+            "body": content,  # 이미지/관련 글/상품 블록을 붙이기 전 재작성 본문 (글 색인용)
+            "tags": parsed["tags"],
+            "meta_description": parsed["meta_description"],
+            "original_url": raw_data['url']
+        }
+
+    def process_content(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.client:
+            return self._demo_result(raw_data)
+
+        deadline = Deadline(self.article_budget)
+        prompt = self._build_prompt(raw_data)
+        cache_key = self._cache_key(prompt)
+        full_text = self.response_cache.get(cache_key)
+        if full_text is None and self.stream and self.output_format != "json":
+            return self._process_streaming(raw_data, prompt, cache_key, deadline)
+
+        side_tasks = self._start_side_tasks(raw_data, deadline=deadline)
+        try:
+            if full_text is not None:
+                print("[LLM 캐시] 저장된 재작성 결과 사용")
+                usage = token_usage(None)
+            else:
+                response = self.client.models.generate_content(
+                    model=MODEL_NAME,
+                    contents=[prompt],
+                    config=self.generation_config,
+                    deadline=deadline.child(self.rewrite_budget_share),
+                )
+                full_text = response.text
+                usage = token_usage(response)
             
-            # 내부 링크 추가
-            internal_links = self._generate_internal_links_html()
-            
-            # 최종 콘텐츠 조합
-            final_content = main_image + "\n" + content
-            
-            # 내부 링크가 있으면 출처 앞에 삽입
-            if internal_links:
-                # 출처 링크 찾기
-                source_marker = f'출처: <a href="{raw_data["url"]}">'
-                if source_marker in final_content:
-                    final_content = final_content.replace(
-                        source_marker, 
-                        internal_links + "\n<p>" + source_marker
-                    )
-                else:
-                    final_content += "\n" + internal_links
-            
-            # 쿠팡 파트너스 상품 추천 추가
-            if self.coupang_recommender:
-                try:
-                    product_html = self.coupang_recommender.generate_product_html(title, content)
-                    if product_html:
-                        final_content += "\n" + product_html
-                        print("[쿠팡 파트너스] 상품 추천 추가됨")
-                except Exception as e:
-                    print(f"[쿠팡 파트너스] 상품 추천 실패: {e}")
-            
-            return {
-                "title": title,
-                "content": final_content,
-                "tags": tags,
-                "meta_description": meta_description,
-                "original_url": raw_data['url']
-            }
+            parsed, repair_usage = self._parse_output(full_text, raw_data, cache_key, deadline)
+            result = self._build_result(raw_data, parsed, side_tasks, deadline)
+            result["usage"] = {key: usage[key] + repair_usage[key] for key in usage}
+            return result
             
         except Exception as e:
-            print(f"Gemini API 오류: {e}")
-            return {
-                "title": raw_data['title'],
-                "content": f"Error: {e}",
-                "tags": ["Error"],
-                "meta_description": "",
-                "original_url": raw_data['url']
-            }
+            for task in side_tasks.values():
+                task.cancel()
+            return self._error_result(raw_data, e)
+
+    def _process_streaming(self, raw_data: Dict[str, Any], prompt: str, cache_key: str,
+                           deadline: Deadline) -> Dict[str, Any]:
+        """
+        스트리밍 재작성: 헤더 줄을 받는 즉시 파싱하고,
+        ALT 줄이 완성되면 그 설명으로 이미지 생성을 바로 시작합니다.
+        """
+        side_tasks = self._start_side_tasks(raw_data, start_image=False, deadline=deadline)
+
+        def on_header(key: str, value: str):
+            if key == "ALT" and value and "image" not in side_tasks:
+                print(f"이미지 생성 시작 (스트리밍 ALT: {value})")
+                side_tasks["image"] = self._start_image(value, deadline)
+
+        parser = StreamingHeaderParser(on_header=on_header)
+        usage = token_usage(None)
+        try:
+            for chunk in self.client.models.generate_content_stream(
+                model=MODEL_NAME,
+                contents=[prompt],
+                config=self.generation_config,
+                deadline=deadline.child(self.rewrite_budget_share),
+            ):
+                if chunk.text:
+                    parser.feed(chunk.text)
+                if chunk.usage_metadata:
+                    usage = token_usage(chunk)
+            parser.close()
+
+            self._cache_output(cache_key, parser)
+            result = self._build_result(raw_data, self._parsed_from_stream(parser, raw_data), side_tasks, deadline)
+            result["usage"] = usage
+            return result
+
+        except Exception as e:
+            for task in side_tasks.values():
+                task.cancel()
+            return self._error_result(raw_data, e)
+
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 기사를 한 번에 재작성 (batch_backend로 묶어서 제출)
+
+        캐시에 없는 기사만 백엔드에 넘기고, 결과는 입력 순서대로 돌려줍니다.
+        한 기사의 생성/후처리 실패는 그 기사의 에러 결과로만 남습니다.
+        """
+        if not self.batch_backend:
+            return [self._demo_result(item) for item in items]
+
+        # 배치 생성 시간은 GEMINI_BATCH_TIMEOUT으로 따로 제한되므로 기사 예산은 이미지 단계에만 적용
+        # (여러 기사의 작업이 한꺼번에 대기열에 들어가므로 이미지 예산은 작업이 시작될 때부터 셈)
+        side_tasks = [self._start_side_tasks(item, budget=self.article_budget) for item in items]
+        prompts = [self._build_prompt(item) for item in items]
+        cache_keys = [self._cache_key(prompt) for prompt in prompts]
+        generations = []
+        for cache_key in cache_keys:
+            text = self.response_cache.get(cache_key)
+            generations.append(Generation(text, token_usage(None)) if text is not None else None)
+        pending = [i for i, generation in enumerate(generations) if generation is None]
+        print(f"[batch] {len(items)}개 중 캐시 {len(items) - len(pending)}개, 생성 {len(pending)}개")
+
+        if pending:
+            # 캐시는 _parse_output에서 파싱/검증을 통과한 결과만 저장
+            generated = self.batch_backend.generate([prompts[i] for i in pending])
+            for i, generation in zip(pending, generated):
+                generations[i] = generation
+
+        results = []
+        for item, generation, tasks, cache_key in zip(items, generations, side_tasks, cache_keys):
+            if isinstance(generation, Exception):
+                for task in tasks.values():
+                    task.cancel()
+                results.append(self._error_result(item, generation))
+                continue
+            try:
+                deadline = Deadline(self.article_budget)
+                parsed, repair_usage = self._parse_output(generation.text, item, cache_key, deadline)
+                result = self._build_result(item, parsed, tasks, deadline)
+                result["usage"] = {key: generation.usage[key] + repair_usage[key] for key in generation.usage}
+                results.append(result)
+            except Exception as e:
+                results.append(self._error_result(item, e))
+        return results
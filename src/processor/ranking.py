@@ -0,0 +1,77 @@
+"""
+후보 기사 점수화 및 상위 K개 선택
+=============================
+모든 크롤러의 후보를 하나의 풀로 모아 최신성, 반응(HN 점수/댓글 수),
+소스 가중치, 과거 발행 기사 대비 새로움으로 점수를 매기고
+실행당 발행 예산만큼 상위 기사를 고릅니다. 점수 계산은 NumPy 배열 연산으로 처리합니다.
+"""
+
+import datetime
+from typing import List, Dict, Any, Optional
+import numpy as np
+from .dedup import NearDuplicateIndex, item_signature
+
+# 점수 구성 가중치
+RECENCY_WEIGHT = 0.45
+ENGAGEMENT_WEIGHT = 0.25
+NOVELTY_WEIGHT = 0.30
+# 최신성 반감기 (시간)
+HALF_LIFE_HOURS = 12.0
+
+
+def _age_hours(items: List[Dict[str, Any]], now: datetime.datetime) -> np.ndarray:
+    ages = np.full(len(items), HALF_LIFE_HOURS)  # 시간 정보가 없으면 반감기만큼 지난 것으로 취급
+    for i, item in enumerate(items):
+        try:
+            timestamp = datetime.datetime.fromisoformat(item["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
+        ages[i] = max(0.0, (now - timestamp).total_seconds() / 3600)
+    return ages
+
+
+def score_candidates(items: List[Dict[str, Any]], source_weights: Optional[Dict[str, float]] = None,
+                     history: Optional[NearDuplicateIndex] = None,
+                     now: Optional[datetime.datetime] = None) -> np.ndarray:
+    """후보 기사 점수 배열 반환 (items와 같은 순서)"""
+    if not items:
+        return np.zeros(0)
+    now = now or datetime.datetime.now()
+    source_weights = source_weights or {}
+
+    recency = np.exp2(-_age_hours(items, now) / HALF_LIFE_HOURS)
+
+    points = np.array([item.get("score") or 0 for item in items], dtype=float)
+    comments = np.array([item.get("comments") or 0 for item in items], dtype=float)
+    engagement = np.log1p(points) + 0.5 * np.log1p(comments)
+    if engagement.max() > 0:
+        engagement /= engagement.max()
+
+    novelty = np.ones(len(items))
+    if history is not None:
+        novelty -= np.array([history.max_similarity(item_signature(item)) for item in items])
+
+    weights = np.array([source_weights.get(item.get("source"), 1.0) for item in items])
+    return weights * (RECENCY_WEIGHT * recency + ENGAGEMENT_WEIGHT * engagement + NOVELTY_WEIGHT * novelty)
+
+
+def select_top_k(items: List[Dict[str, Any]], k: int, max_per_source: int = 1,
+                 **score_kwargs) -> List[Dict[str, Any]]:
+    """
+    점수 상위 k개 선택 (소스당 최대 max_per_source개로 다양성 유지)
+    score_kwargs는 score_candidates에 그대로 전달됩니다.
+    """
+    scores = score_candidates(items, **score_kwargs)
+    selected, per_source = [], {}
+    for i in np.argsort(-scores, kind="stable"):
+        if len(selected) >= k:
+            break
+        source = items[i].get("source")
+        if per_source.get(source, 0) >= max_per_source:
+            continue
+        per_source[source] = per_source.get(source, 0) + 1
+        items[i]["rank_score"] = float(scores[i])
+        selected.append(items[i])
+    return selected
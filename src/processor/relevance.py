@@ -0,0 +1,95 @@
+"""
+AI 관련성 사전 필터
+=============================
+Gemini 호출 전에 후보 기사 전체를 한 번에 점수화해서 AI와 무관한 기사를 걸러냅니다.
+미리 정해둔 가중치 어휘(IDF 성격의 가중치)와 NumPy 행렬 연산만 사용하므로
+모델 로드는 즉시 끝나고 외부 호출이 없습니다.
+"""
+
+import os
+import re
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+# 용어별 가중치 (AI 특이성이 높을수록 큼, 일반 테크 용어는 낮게)
+AI_VOCABULARY = {
+    # 핵심 용어
+    "ai": 1.5, "artificial intelligence": 3.0, "machine learning": 3.0, "deep learning": 3.0,
+    "neural network": 3.0, "neural": 2.0, "llm": 3.0, "llms": 3.0, "large language": 3.0,
+    "language model": 3.0, "generative": 2.5, "genai": 3.0, "transformer": 2.0, "inference": 1.5,
+    "training": 1.0, "finetuning": 2.5, "fine tuning": 2.5, "model": 0.8, "models": 0.8,
+    "chatbot": 2.5, "chatbots": 2.5, "agent": 1.0, "agents": 1.0, "agentic": 3.0, "reasoning": 1.5,
+    "multimodal": 2.5, "diffusion": 2.0, "embedding": 2.0, "embeddings": 2.0, "rag": 2.0,
+    "prompt": 1.5, "prompts": 1.5, "token": 0.8, "tokens": 0.8, "benchmark": 1.0, "dataset": 1.5,
+    "gpu": 1.5, "gpus": 1.5, "robot": 1.5, "robots": 1.5, "robotics": 2.0, "autonomous": 1.5,
+    "self driving": 2.0, "computer vision": 3.0, "speech recognition": 2.5, "copilot": 2.5,
+    # 회사/제품
+    "openai": 3.0, "chatgpt": 3.0, "gpt": 3.0, "anthropic": 3.0, "claude": 2.5, "gemini": 2.5,
+    "deepmind": 3.0, "mistral": 2.5, "llama": 2.5, "hugging face": 3.0, "huggingface": 3.0,
+    "stable diffusion": 3.0, "midjourney": 3.0, "dall": 3.0, "sora": 2.5, "perplexity": 2.0,
+    "nvidia": 1.5, "cuda": 2.0, "xai": 2.5, "grok": 2.5, "deepseek": 3.0, "qwen": 3.0,
+    # 한국어
+    "인공지능": 3.0, "머신러닝": 3.0, "딥러닝": 3.0, "생성형": 2.5, "챗봇": 2.5, "언어모델": 3.0,
+    "로봇": 1.5, "자율주행": 1.5, "반도체": 1.0,
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9가-힣]+")
+# 이 길이(토큰)까지는 길이 보정을 하지 않음 (제목만 있는 HN 기사 등)
+SHORT_DOC_TOKENS = 20
+
+
+class RelevanceClassifier:
+    """
+    키워드 가중치 기반 AI 관련성 분류기
+
+    점수 = Σ 가중치 × (1 + ln tf) / sqrt(max(토큰 수, 20) / 20)
+    제목은 본문보다 신호가 강하므로 두 번 셉니다.
+    """
+
+    def __init__(self, vocabulary: Optional[Dict[str, float]] = None, threshold: Optional[float] = None):
+        vocabulary = vocabulary or AI_VOCABULARY
+        self.terms = {term: i for i, term in enumerate(vocabulary)}
+        self.weights = np.array(list(vocabulary.values()), dtype=float)
+        self.threshold = threshold if threshold is not None else float(os.getenv("RELEVANCE_THRESHOLD", "1.0"))
+
+    def _tokens(self, item: Dict[str, Any]) -> List[str]:
+        title = (item.get("title") or "").lower()
+        body = _TAG_RE.sub(" ", item.get("original_content") or "").lower()
+        words = _TOKEN_RE.findall(title) * 2 + _TOKEN_RE.findall(body)
+        # 두 단어 용어("machine learning" 등)도 함께 매칭
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def scores(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """아이템별 관련성 점수 (items와 같은 순서)"""
+        if not items:
+            return np.zeros(0)
+
+        rows, cols, lengths = [], [], np.zeros(len(items))
+        for i, item in enumerate(items):
+            tokens = self._tokens(item)
+            lengths[i] = len(tokens) / 2  # 바이그램 제외한 대략적인 단어 수
+            for token in tokens:
+                j = self.terms.get(token)
+                if j is not None:
+                    rows.append(i)
+                    cols.append(j)
+
+        counts = np.zeros((len(items), len(self.weights)))
+        np.add.at(counts, (rows, cols), 1)
+        tf = np.zeros_like(counts)
+        np.log(counts, out=tf, where=counts > 0)
+        tf[counts > 0] += 1
+        return (tf @ self.weights) / np.sqrt(np.maximum(lengths, SHORT_DOC_TOKENS) / SHORT_DOC_TOKENS)
+
+    def filter(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """임계값 이상인 아이템만 반환"""
+        scores = self.scores(items)
+        kept = []
+        for item, score in zip(items, scores):
+            item["relevance"] = float(score)
+            if score >= self.threshold:
+                kept.append(item)
+            else:
+                print(f"[relevance] AI 무관 기사 제외 ({score:.2f}): {item.get('title')}")
+        return kept
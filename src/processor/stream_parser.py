@@ -0,0 +1,76 @@
+import io
+from typing import Callable, Dict, Optional
+
+HEADER_KEYS = ("TITLE", "META", "ALT", "TAGS")
+
+
+class StreamingHeaderParser:
+    """
+    스트리밍 응답의 TITLE/META/ALT/TAGS 헤더 줄을 도착하는 대로 파싱
+
+    헤더 줄이 완성될 때마다 on_header(키, 값)를 호출하고,
+    헤더가 아닌 첫 줄부터는 청크를 본문 버퍼(io.StringIO)에 그대로 이어 씁니다.
+    응답 전체를 따로 보관하지 않고, text는 파싱한 헤더와 본문 버퍼로 다시 만듭니다.
+    """
+
+    def __init__(self, on_header: Optional[Callable[[str, str], None]] = None):
+        self.on_header = on_header
+        self.headers: Dict[str, str] = {}
+        self._line = io.StringIO()
+        self._body = io.StringIO()
+        self._in_body = False
+
+    def feed(self, chunk: str):
+        if self._in_body:
+            self._body.write(chunk)
+            return
+
+        start = 0
+        while not self._in_body:
+            newline = chunk.find("\n", start)
+            if newline < 0:
+                self._line.write(chunk[start:])
+                return
+            self._line.write(chunk[start:newline])
+            line = self._line.getvalue()
+            self._line = io.StringIO()
+            start = newline + 1
+            if not self._handle_line(line):
+                # 헤더가 아닌 첫 줄부터 본문
+                self._in_body = True
+                self._body.write(line + "\n")
+        self._body.write(chunk[start:])
+
+    def _handle_line(self, line: str) -> bool:
+        """헤더 줄이거나 빈 줄이면 True, 본문이 시작되면 False"""
+        stripped = line.strip()
+        if not stripped:
+            return True
+        for key in HEADER_KEYS:
+            if stripped.startswith(key + ":"):
+                value = stripped[len(key) + 1:].strip()
+                self.headers[key] = value
+                if self.on_header:
+                    self.on_header(key, value)
+                return True
+        return False
+
+    def close(self):
+        """스트림 종료 (마지막 줄에 줄바꿈이 없어도 처리)"""
+        if not self._in_body:
+            line = self._line.getvalue()
+            self._line = io.StringIO()
+            if line and not self._handle_line(line):
+                self._in_body = True
+                self._body.write(line)
+
+    @property
+    def body(self) -> str:
+        return self._body.getvalue().strip()
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 응답 텍스트 (헤더 줄 + 본문, 다시 파싱하면 같은 결과)"""
+        lines = [f"{key}: {value}" for key, value in self.headers.items()]
+        lines.append(self._body.getvalue())
+        return "\n".join(lines)
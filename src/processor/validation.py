@@ -0,0 +1,112 @@
+"""
+재작성 결과 검증
+=============================
+구조화 출력(JSON) 모드에서 받은 글을 필드별로 검사합니다.
+본문 HTML은 HTMLParser로 한 번만 훑으면서 허용 태그, 마크다운 흔적,
+첫 소제목(h2), 최소 길이를 함께 확인합니다.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+from typing import Dict, Any, List, Optional
+
+ALLOWED_TAGS = {"h2", "p", "strong", "em", "b", "blockquote", "ul", "ol", "li", "a", "br"}
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+MIN_CONTENT_CHARS = int(os.getenv("MIN_CONTENT_CHARS", "1000"))
+
+# 줄 맨 앞의 마크다운 제목/목록, 또는 굵게 표시(**)
+_MARKDOWN_RE = re.compile(r"(^|\n)\s*(#{1,6}\s|[-*]\s)|\*\*[^*]+\*\*")
+
+# 구조화 출력 스키마 (Gemini response_schema 형식)
+ARTICLE_FIELDS = {
+    "title": {"type": "STRING", "description": "핵심 키워드로 시작하는 30자 내외 제목"},
+    "meta_description": {"type": "STRING", "description": "150자 내외 메타 설명"},
+    "alt_text": {"type": "STRING", "description": "구체적인 이미지 대체 텍스트"},
+    "tags": {"type": "ARRAY", "items": {"type": "STRING"}, "description": "관련 태그 5개"},
+    "content": {"type": "STRING", "description": "HTML 본문 (h2 소제목으로 시작)"},
+}
+
+
+def article_schema(fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """지정한 필드만 담은 응답 스키마 (기본: 전체 필드)"""
+    fields = fields or list(ARTICLE_FIELDS)
+    return {
+        "type": "OBJECT",
+        "properties": {field: ARTICLE_FIELDS[field] for field in fields},
+        "required": fields,
+        "property_ordering": fields,
+    }
+
+
+class _ContentChecker(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.disallowed = set()
+        self.first_heading = None
+        self.text_chars = 0
+        self.markdown = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HEADING_TAGS and self.first_heading is None:
+            self.first_heading = tag
+        if tag not in ALLOWED_TAGS:
+            self.disallowed.add(tag)
+
+    def handle_data(self, data):
+        self.text_chars += len(data.strip())
+        if not self.markdown and _MARKDOWN_RE.search(data):
+            self.markdown = True
+
+
+def validate_content(content: str) -> List[str]:
+    """HTML 본문 문제 목록 (문제가 없으면 빈 리스트)"""
+    checker = _ContentChecker()
+    checker.feed(content or "")
+    checker.close()
+
+    problems = []
+    if checker.disallowed:
+        problems.append(f"허용되지 않은 태그 사용: {', '.join(sorted(checker.disallowed))}")
+    if checker.markdown:
+        problems.append("마크다운 문법(**, #, - 등) 사용")
+    if checker.first_heading != "h2":
+        problems.append("첫 소제목이 <h2>가 아님")
+    if checker.text_chars < MIN_CONTENT_CHARS:
+        problems.append(f"본문이 너무 짧음 ({checker.text_chars}자 < {MIN_CONTENT_CHARS}자)")
+    return problems
+
+
+def validate_article(article: Dict[str, Any]) -> Dict[str, str]:
+    """
+    필드별 검증 결과 {필드: 문제 설명} (모두 통과하면 빈 dict)
+    """
+    errors = {}
+    title = article.get("title")
+    if not isinstance(title, str) or not title.strip():
+        errors["title"] = "제목이 비어 있음"
+    elif len(title) > 60:
+        errors["title"] = f"제목이 너무 김 ({len(title)}자)"
+
+    meta = article.get("meta_description")
+    if not isinstance(meta, str) or not meta.strip():
+        errors["meta_description"] = "메타 설명이 비어 있음"
+    elif len(meta) > 200:
+        errors["meta_description"] = f"메타 설명이 너무 김 ({len(meta)}자)"
+
+    alt_text = article.get("alt_text")
+    if not isinstance(alt_text, str) or not alt_text.strip():
+        errors["alt_text"] = "이미지 대체 텍스트가 비어 있음"
+
+    tags = article.get("tags")
+    if not isinstance(tags, list) or not 3 <= len([t for t in tags if isinstance(t, str) and t.strip()]) <= 10:
+        errors["tags"] = "태그는 3~10개의 문자열이어야 함"
+
+    content = article.get("content")
+    if not isinstance(content, str):
+        errors["content"] = "본문이 없음"
+    else:
+        problems = validate_content(content)
+        if problems:
+            errors["content"] = "; ".join(problems)
+    return errors
@@ -1,6 +1,7 @@
 import requests
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
 
 class BloggerPublisher:
     """
@@ -75,3 +76,45 @@ class BloggerPublisher:
         except Exception as e:
             print(f"Blogger API 오류: {e}")
             return f"Error: {e}"
+
+    def _auth_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json"
+        }
+
+    def get_post_by_url(self, post_url: str) -> Optional[Dict[str, Any]]:
+        """발행된 글 URL로 글 조회 (id, content 등), 실패 시 None"""
+        if not all([self.blog_id, self.access_token]):
+            return None
+        try:
+            response = requests.get(
+                f"{self.API_BASE}/blogs/{self.blog_id}/posts/bypath",
+                headers=self._auth_headers(),
+                params={"path": urlsplit(post_url).path},
+                timeout=30,
+            )
+            if response.status_code == 200:
+                return response.json()
+            print(f"Blogger 글 조회 실패: {response.status_code} - {response.text[:200]}")
+        except Exception as e:
+            print(f"Blogger API 오류: {e}")
+        return None
+
+    def update_post_content(self, post_id: str, content: str) -> bool:
+        """글 본문만 수정 (PATCH)"""
+        if not all([self.blog_id, self.access_token]):
+            return False
+        try:
+            response = requests.patch(
+                f"{self.API_BASE}/blogs/{self.blog_id}/posts/{post_id}",
+                headers=self._auth_headers(),
+                json={"content": content},
+                timeout=30,
+            )
+            if response.status_code == 200:
+                return True
+            print(f"Blogger 글 수정 실패: {response.status_code} - {response.text[:200]}")
+        except Exception as e:
+            print(f"Blogger API 오류: {e}")
+        return False
@@ -0,0 +1,7 @@
+from .paths import data_path
+from .seen_store import SeenStore, canonicalize_url, title_hash
+from .kv_cache import PersistentCache
+from .post_index import PostIndex
+from .image_store import ImageStore
+
+__all__ = ['data_path', 'SeenStore', 'canonicalize_url', 'title_hash', 'PersistentCache', 'PostIndex', 'ImageStore']
@@ -0,0 +1,183 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from .paths import data_path
+
+_IMG_SRC_RE = re.compile(r"""<img\b[^>]*\bsrc=["']([^"']+)["']""", re.IGNORECASE)
+MIME_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp", "image/gif": "gif"}
+
+
+def prompt_key(prompt: str) -> str:
+    """이미지 프롬프트 정규화 키 (대소문자/공백/구두점 차이는 무시)"""
+    normalized = " ".join(re.findall(r"\w+", (prompt or "").lower()))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def image_urls(html: str) -> List[str]:
+    """HTML 안의 <img src> URL 목록"""
+    return _IMG_SRC_RE.findall(html or "")
+
+
+class ImageStore:
+    """
+    생성한 이미지 저장소 (SQLite 색인 + 내용 해시 이름의 파일)
+
+    - 정규화한 프롬프트로 업로드된 URL을 찾아 같은 이미지를 다시 생성하지 않습니다.
+    - 업로드 기록(uploads)은 URL 단위로 남기고 프롬프트는 현재 URL만 가리키므로(prompts),
+      같은 프롬프트를 다시 만들어도 예전 URL을 쓰는 글은 계속 만료 관리 대상에 남습니다.
+    - 업로드 URL의 만료 시각과 그 이미지를 쓰는 글 URL을 기록해 두고,
+      만료가 가까운 이미지는 refresh 스크립트가 원본 파일로 다시 올린 뒤 글을 고칩니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, files_dir: Optional[Path] = None):
+        self.db_path = db_path or data_path("images.sqlite3")
+        self.files_dir = files_dir or data_path("images")
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS uploads (
+                url TEXT PRIMARY KEY,
+                file TEXT,
+                expires_at REAL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS prompts (
+                prompt_key TEXT PRIMARY KEY,
+                prompt TEXT NOT NULL,
+                url TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS image_posts (
+                image_url TEXT NOT NULL,
+                post_url TEXT NOT NULL,
+                PRIMARY KEY (image_url, post_url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_prompts_url ON prompts (url);
+            CREATE INDEX IF NOT EXISTS idx_uploads_expires ON uploads (expires_at);
+        """)
+        self._migrate()
+
+    def _migrate(self):
+        """프롬프트 키로 한 행만 두던 예전 images 테이블을 uploads/prompts로 옮김"""
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'images'").fetchone():
+            return
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO uploads (url, file, expires_at, created_at) "
+                              "SELECT url, file, expires_at, created_at FROM images")
+            self.conn.execute("INSERT OR IGNORE INTO prompts (prompt_key, prompt, url) "
+                              "SELECT prompt_key, prompt, url FROM images")
+            self.conn.execute("DROP TABLE images")
+
+    def lookup(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """프롬프트가 현재 가리키는 업로드 기록 (만료 여부와 무관, 없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT u.url, u.file, u.expires_at FROM prompts p JOIN uploads u ON u.url = p.url "
+                "WHERE p.prompt_key = ?", (prompt_key(prompt),)
+            ).fetchone()
+        return dict(zip(("url", "file", "expires_at"), row)) if row else None
+
+    def get(self, prompt: str, min_ttl: float = 0.0) -> Optional[str]:
+        """프롬프트에 해당하는 업로드 URL (없거나 min_ttl초 안에 만료되면 None)"""
+        image = self.lookup(prompt)
+        if image is None:
+            return None
+        if image["expires_at"] is not None and image["expires_at"] - time.time() <= min_ttl:
+            return None
+        return image["url"]
+
+    def put(self, prompt: str, url: str, data: Optional[bytes] = None, mime_type: str = "image/png",
+            expires_at: Optional[float] = None):
+        """
+        업로드한 이미지 기록 (data가 있으면 내용 해시 이름으로 원본 파일 저장)
+        프롬프트는 새 URL을 가리키게 되고, 예전 URL의 업로드 기록과 글 연결은 그대로 남습니다.
+        """
+        file_name = None
+        if data:
+            file_name = f"{hashlib.sha256(data).hexdigest()}.{MIME_EXTENSIONS.get(mime_type, 'bin')}"
+            path = self.files_dir / file_name
+            if not path.exists():
+                path.write_bytes(data)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO uploads (url, file, expires_at, created_at) VALUES (?, ?, ?, ?)",
+                (url, file_name, expires_at, time.time()),
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO prompts (prompt_key, prompt, url) VALUES (?, ?, ?)",
+                (prompt_key(prompt), prompt, url),
+            )
+
+    def file_path(self, file_name: Optional[str]) -> Optional[Path]:
+        if not file_name:
+            return None
+        path = self.files_dir / file_name
+        return path if path.exists() else None
+
+    def link_post(self, post_url: str, html: str) -> int:
+        """글 본문에 들어간 저장소 이미지와 글 URL 연결, 연결한 개수 반환"""
+        urls = image_urls(html)
+        if not urls:
+            return 0
+        with self._lock, self.conn:
+            known = [row[0] for row in self.conn.execute(
+                f"SELECT url FROM uploads WHERE url IN ({','.join('?' * len(urls))})", urls
+            ).fetchall()]
+            self.conn.executemany("INSERT OR IGNORE INTO image_posts (image_url, post_url) VALUES (?, ?)",
+                                  [(url, post_url) for url in known])
+        return len(known)
+
+    def expiring(self, within: float) -> List[Dict[str, Any]]:
+        """within초 안에 만료되는 업로드 (이미 만료된 것 포함, 프롬프트가 다른 URL로 옮겨간 것도 포함)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, file, expires_at FROM uploads "
+                "WHERE expires_at IS NOT NULL AND expires_at < ? ORDER BY expires_at",
+                (time.time() + within,),
+            ).fetchall()
+        return [dict(zip(("url", "file", "expires_at"), row)) for row in rows]
+
+    def posts_using(self, image_url: str) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute("SELECT post_url FROM image_posts WHERE image_url = ?", (image_url,)).fetchall()
+        return [row[0] for row in rows]
+
+    def replace_url(self, old_url: str, new_url: str, expires_at: Optional[float]):
+        """다시 올린 이미지로 교체 (글 연결과 아직 예전 URL을 가리키는 프롬프트도 새 URL로 이동)"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO uploads (url, file, expires_at, created_at) "
+                "SELECT ?, file, ?, ? FROM uploads WHERE url = ?",
+                (new_url, expires_at, time.time(), old_url),
+            )
+            self.conn.execute("UPDATE prompts SET url = ? WHERE url = ?", (new_url, old_url))
+            self.conn.execute("UPDATE OR IGNORE image_posts SET image_url = ? WHERE image_url = ?",
+                              (new_url, old_url))
+            self.conn.execute("DELETE FROM image_posts WHERE image_url = ?", (old_url,))
+            self.conn.execute("DELETE FROM uploads WHERE url = ?", (old_url,))
+
+    def prune(self) -> int:
+        """만료됐고 쓰는 글도 없는 업로드 삭제 (원본 파일 포함), 삭제된 개수 반환"""
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT url, file FROM uploads WHERE expires_at IS NOT NULL AND expires_at < ? "
+                "AND url NOT IN (SELECT image_url FROM image_posts)",
+                (time.time(),),
+            ).fetchall()
+            self.conn.executemany("DELETE FROM uploads WHERE url = ?", [(row[0],) for row in rows])
+            self.conn.execute("DELETE FROM prompts WHERE url NOT IN (SELECT url FROM uploads)")
+            # 같은 내용의 파일을 다른 업로드가 쓰고 있으면 남김
+            in_use = {row[0] for row in self.conn.execute("SELECT file FROM uploads WHERE file IS NOT NULL")}
+        for _, file_name in rows:
+            path = self.file_path(file_name)
+            if path and file_name not in in_use:
+                path.unlink()
+        return len(rows)
+
+    def close(self):
+        self.conn.close()
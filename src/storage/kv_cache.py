@@ -0,0 +1,75 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+
+class PersistentCache:
+    """
+    SQLite 기반 키-값 캐시 (TTL + 크기 제한 LRU)
+
+    값은 JSON으로 저장되며, max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    ttl(초)이 지난 항목은 없는 것으로 취급하고 prune()에서 정리됩니다.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 1000, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+        """)
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값 반환 (없거나 만료되면 None)"""
+        entry = self.get_with_age(key)
+        return entry[0] if entry else None
+
+    def get_with_age(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(캐시된 값, 저장 후 지난 초) 반환 (없거나 만료되면 None, stale-while-revalidate용)"""
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self.conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0]), now - row[1]
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            # 크기 제한 초과분은 가장 오래 사용하지 않은 항목부터 삭제
+            self.conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def prune(self) -> int:
+        """만료된 항목 삭제, 삭제된 개수 반환"""
+        if self.ttl is None:
+            return 0
+        with self._lock, self.conn:
+            cursor = self.conn.execute("DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl,))
+        return cursor.rowcount
@@ -0,0 +1,16 @@
+import os
+from pathlib import Path
+
+# 실행 간에 유지되는 로컬 데이터 위치 (GitHub Actions에서는 actions/cache로 보존)
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+def data_path(*parts: str) -> Path:
+    """
+    데이터 디렉터리 아래 경로를 반환합니다. (AI_FEED_DATA_DIR 환경변수로 변경 가능)
+    상위 디렉터리는 자동으로 생성됩니다.
+    """
+    base = Path(os.getenv("AI_FEED_DATA_DIR") or DEFAULT_DATA_DIR)
+    path = base.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,166 @@
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from .paths import data_path
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9가-힣]+")
+# 관련도 계산에서 제외할 흔한 단어
+STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "will", "has", "have", "its",
+    "into", "about", "more", "than", "new", "how", "what", "why", "you", "your", "our", "can", "not",
+    "http", "https", "www", "com", "html", "출처", "원문", "보기", "관련", "있습니다", "합니다", "있는",
+    "이번", "통해", "대한", "위한", "그리고", "하지만", "또한", "수", "및",
+}
+# 글마다 색인할 최대 키워드 수 (가중치 상위)
+MAX_TERMS_PER_POST = 40
+# 공유 태그 하나당 가산점
+TAG_BOOST = 0.15
+
+
+def _term_vector(title: str, content: str) -> Dict[str, float]:
+    """제목(2배)과 본문 텍스트의 로그 tf 가중치 (상위 MAX_TERMS_PER_POST개)"""
+    text = _TAG_RE.sub(" ", content or "").lower()
+    words = _TOKEN_RE.findall((title or "").lower()) * 2 + _TOKEN_RE.findall(text)
+    counts = Counter(w for w in words if len(w) > 1 and w not in STOPWORDS)
+    top = counts.most_common(MAX_TERMS_PER_POST)
+    return {term: 1 + math.log(count) for term, count in top}
+
+
+def _normalize_tags(tags: Optional[List[str]]) -> List[str]:
+    return sorted({tag.strip().lower() for tag in tags or [] if tag and tag.strip()})
+
+
+class PostIndex:
+    """
+    발행한 글 색인 (SQLite, 내부 링크용)
+
+    글마다 제목, URL, 태그, 키워드 가중치를 저장하고 키워드/태그 역색인으로
+    새 글과 관련도가 높은 과거 글을 찾습니다. 역색인에 걸린 후보 글만 점수를 계산합니다.
+    관련도 = Σ idf × (쿼리 tf × 글 tf) / (|쿼리| × |글|) + 공유 태그 수 × TAG_BOOST
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or data_path("posts.sqlite3")
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                norm REAL NOT NULL,
+                published_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS post_terms (
+                term TEXT NOT NULL,
+                post_id INTEGER NOT NULL,
+                weight REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS post_tags (
+                tag TEXT NOT NULL,
+                post_id INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_published ON posts (published_at);
+            CREATE INDEX IF NOT EXISTS idx_post_terms_term ON post_terms (term);
+            CREATE INDEX IF NOT EXISTS idx_post_terms_post ON post_terms (post_id);
+            CREATE INDEX IF NOT EXISTS idx_post_tags_tag ON post_tags (tag);
+            CREATE INDEX IF NOT EXISTS idx_post_tags_post ON post_tags (post_id);
+        """)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def add(self, title: str, url: str, tags: Optional[List[str]] = None, content: str = ""):
+        """발행한 글 색인 (같은 URL이면 갱신)"""
+        tags = _normalize_tags(tags)
+        vector = _term_vector(title, content)
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT id FROM posts WHERE url = ?", (url,)).fetchone()
+            if row:
+                post_id = row[0]
+                self.conn.execute("DELETE FROM post_terms WHERE post_id = ?", (post_id,))
+                self.conn.execute("DELETE FROM post_tags WHERE post_id = ?", (post_id,))
+                self.conn.execute("UPDATE posts SET title = ?, tags = ?, norm = ? WHERE id = ?",
+                                  (title, json.dumps(tags, ensure_ascii=False), norm, post_id))
+            else:
+                post_id = self.conn.execute(
+                    "INSERT INTO posts (url, title, tags, norm, published_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, title, json.dumps(tags, ensure_ascii=False), norm, time.time()),
+                ).lastrowid
+            self.conn.executemany("INSERT INTO post_terms (term, post_id, weight) VALUES (?, ?, ?)",
+                                  [(term, post_id, weight) for term, weight in vector.items()])
+            self.conn.executemany("INSERT INTO post_tags (tag, post_id) VALUES (?, ?)",
+                                  [(tag, post_id) for tag in tags])
+
+    def recent(self, limit: int = 3, exclude: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """최근 발행 순 (exclude: 제외할 URL)"""
+        exclude = exclude or []
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT url, title FROM posts ORDER BY published_at DESC LIMIT ?",
+                (limit + len(exclude),),
+            ).fetchall()
+        return [{"title": title, "url": url} for url, title in rows if url not in exclude][:limit]
+
+    def related(self, title: str, content: str = "", tags: Optional[List[str]] = None,
+                limit: int = 3, exclude: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        관련도 높은 과거 글 (부족한 자리는 최근 글로 채움)
+        """
+        exclude = set(exclude or [])
+        query = _term_vector(title, content)
+        tags = _normalize_tags(tags)
+
+        with self._lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            if not total:
+                return []
+            scores: Dict[int, float] = {}
+            if query:
+                marks = ",".join("?" * len(query))
+                query_norm = math.sqrt(sum(w * w for w in query.values()))
+                df = dict(self.conn.execute(
+                    f"SELECT term, COUNT(*) FROM post_terms WHERE term IN ({marks}) GROUP BY term", list(query)
+                ).fetchall())
+                rows = self.conn.execute(
+                    f"SELECT t.post_id, t.term, t.weight, p.norm FROM post_terms t JOIN posts p ON p.id = t.post_id "
+                    f"WHERE t.term IN ({marks})", list(query)
+                ).fetchall()
+                for post_id, term, weight, norm in rows:
+                    idf = math.log(1 + total / df[term])
+                    scores[post_id] = scores.get(post_id, 0.0) + idf * query[term] * weight / (query_norm * norm)
+            if tags:
+                for (post_id,) in self.conn.execute(
+                    f"SELECT post_id FROM post_tags WHERE tag IN ({','.join('?' * len(tags))})", tags
+                ).fetchall():
+                    scores[post_id] = scores.get(post_id, 0.0) + TAG_BOOST
+
+            best = sorted(scores.items(), key=lambda kv: (-kv[1], -kv[0]))
+            posts = []
+            for post_id, _ in best:
+                url, post_title = self.conn.execute(
+                    "SELECT url, title FROM posts WHERE id = ?", (post_id,)
+                ).fetchone()
+                if url not in exclude:
+                    posts.append({"title": post_title, "url": url})
+                if len(posts) >= limit:
+                    break
+
+        if len(posts) < limit:
+            chosen = exclude | {post["url"] for post in posts}
+            posts += self.recent(limit - len(posts), exclude=list(chosen))
+        return posts
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,93 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from .paths import data_path
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src", "mc_cid", "mc_eid", "guccounter"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화: 스킴/호스트 소문자화, www. 제거, 추적 파라미터(utm_* 등)와 fragment 제거,
+    쿼리 정렬, 끝의 / 제거
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host, path, urlencode(query), ""))
+
+
+def title_hash(title: str) -> str:
+    """제목 해시 (대소문자/공백/구두점 차이는 무시)"""
+    normalized = " ".join(re.findall(r"\w+", title.lower()))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class SeenStore:
+    """
+    이미 처리한 기사 목록 (SQLite)
+
+    정규화된 원문 URL과 제목 해시를 기록해 다음 실행에서 같은 기사를
+    다시 재작성/발행하지 않도록 합니다. 오래된 기록은 TTL 기준으로 정리합니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or data_path("seen.sqlite3")
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen (
+                url_key TEXT PRIMARY KEY,
+                title_hash TEXT NOT NULL,
+                url TEXT,
+                title TEXT,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_title_hash ON seen (title_hash);
+            CREATE INDEX IF NOT EXISTS idx_seen_seen_at ON seen (seen_at);
+        """)
+
+    def is_seen(self, item: Dict[str, Any]) -> bool:
+        """URL 또는 제목이 이미 기록되어 있으면 True"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM seen WHERE url_key = ? OR title_hash = ? LIMIT 1",
+                (canonicalize_url(item.get("url") or ""), title_hash(item.get("title") or "")),
+            ).fetchone()
+        return row is not None
+
+    def filter_unseen(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """처리한 적 없는 아이템만 반환"""
+        return [item for item in items if not self.is_seen(item)]
+
+    def mark_seen(self, item: Dict[str, Any]):
+        """아이템을 처리 완료로 기록"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO seen (url_key, title_hash, url, title, seen_at) VALUES (?, ?, ?, ?, ?)",
+                (canonicalize_url(item.get("url") or ""), title_hash(item.get("title") or ""),
+                 item.get("url"), item.get("title"), time.time()),
+            )
+
+    def prune(self, ttl_days: float) -> int:
+        """ttl_days보다 오래된 기록 삭제, 삭제된 개수 반환"""
+        cutoff = time.time() - ttl_days * 86400
+        with self._lock, self.conn:
+            cursor = self.conn.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,))
+        return cursor.rowcount
+
+    def close(self):
+        self.conn.close()